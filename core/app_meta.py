@@ -13,8 +13,21 @@ from __future__ import annotations
 
 import json
 import os
+import stat
 from typing import Dict, Mapping, MutableMapping, Optional
 
+# Optional fast JSON parser; the stdlib module remains the fallback.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # -------------------------------------------------------------------
 # App metadata
 # -------------------------------------------------------------------
@@ -39,7 +52,10 @@ DEFAULT_SETTINGS: Dict[str, object] = {
     "log_max_lines": 5000,  # Trim log buffer (0 = unlimited)
     "changes_lazy_load": True,  # Lazy load commit list
     "post_script_path": "",  # Optional script executed after install
+    "verbose_spawn_log": False,  # Log every auto-input write (debug chatter)
     "show_details_button": True,  # Show small details link under banner
+    "track_dirty": True,  # Count local changes (skips the worktree scan when off)
+    "partial_clone": False,  # Configure blob:none partial-clone fetches (less history)
     "keep_fish_config": False,  # Backup & restore entire ~/.config/fish (config.fish, functions/, subfolders) before and after install
 }
 
@@ -58,6 +74,12 @@ def get_settings_path() -> str:
     return SETTINGS_FILE
 
 
+# Parsed settings cached against the file's mtime so repeat loads skip the
+# read + json parse while the file is unchanged.
+_SETTINGS_CACHE: Optional[Dict[str, object]] = None
+_SETTINGS_CACHE_MTIME: Optional[int] = None
+
+
 def load_settings() -> Dict[str, object]:
     """
     Load persisted settings from disk, merging with defaults.
@@ -66,17 +88,26 @@ def load_settings() -> Dict[str, object]:
     - If the file does not exist, returns a copy of DEFAULT_SETTINGS.
     - Unknown keys from disk are ignored.
     - Any error while reading/parsing falls back to defaults.
+    - Repeat calls reuse a cached parse while the file mtime is unchanged.
 
     Returns:
         A new dict of merged settings.
     """
+    global _SETTINGS_CACHE, _SETTINGS_CACHE_MTIME
     data: Dict[str, object] = dict(DEFAULT_SETTINGS)
     try:
-        if os.path.isfile(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-            if isinstance(loaded, Mapping):
-                data.update({k: v for k, v in loaded.items() if k in DEFAULT_SETTINGS})
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        return data
+    if _SETTINGS_CACHE is not None and mtime == _SETTINGS_CACHE_MTIME:
+        return dict(_SETTINGS_CACHE)
+    try:
+        with open(SETTINGS_FILE, "rb") as f:
+            loaded = _json_loads(f.read())
+        if isinstance(loaded, Mapping):
+            data.update({k: v for k, v in loaded.items() if k in DEFAULT_SETTINGS})
+        _SETTINGS_CACHE = dict(data)
+        _SETTINGS_CACHE_MTIME = mtime
     except Exception:
         # Corrupt or unreadable settings: return defaults
         pass
@@ -91,14 +122,25 @@ def save_settings(data: Mapping[str, object]) -> None:
         data: Mapping of settings to persist. Only keys present in DEFAULT_SETTINGS
               are written; others are ignored.
     """
+    global _SETTINGS_CACHE, _SETTINGS_CACHE_MTIME
     try:
         os.makedirs(SETTINGS_DIR, exist_ok=True)
         # Only persist known keys to keep the file tidy
         serializable = {k: data.get(k) for k in DEFAULT_SETTINGS.keys()}
+        # Skip the write (and the resulting mtime bump) when nothing changed
+        if _SETTINGS_CACHE is not None and serializable == _SETTINGS_CACHE:
+            return
         tmp = SETTINGS_FILE + ".tmp"
         with open(tmp, "w", encoding="utf-8") as f:
             json.dump(serializable, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, SETTINGS_FILE)
+        _SETTINGS_CACHE = dict(serializable)
+        try:
+            _SETTINGS_CACHE_MTIME = os.stat(SETTINGS_FILE).st_mtime_ns
+        except OSError:
+            _SETTINGS_CACHE_MTIME = None
     except Exception:
         # Best-effort: settings persistence is non-critical
         pass
@@ -127,14 +169,21 @@ def detect_initial_repo_path(settings: MutableMapping[str, object]) -> str:
         The chosen repository path (possibly empty string if none found).
     """
     p = str(settings.get("repo_path") or "").strip()
-    if p and os.path.isdir(p):
-        return p
+    if p:
+        try:
+            if stat.S_ISDIR(os.stat(p).st_mode):
+                return p
+        except OSError:
+            pass
 
     fallback = os.path.expanduser("~/.cache/dots-hyprland")
-    if os.path.isdir(fallback):
-        settings["repo_path"] = fallback
-        save_settings(settings)
-        return fallback
+    try:
+        if stat.S_ISDIR(os.stat(fallback).st_mode):
+            settings["repo_path"] = fallback
+            save_settings(settings)
+            return fallback
+    except OSError:
+        pass
 
     return ""
 
@@ -14,11 +14,184 @@ This module provides:
 
 from __future__ import annotations
 
+import hashlib
 import os
+import re
+import stat
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+from .app_meta import SETTINGS, SETTINGS_DIR
+
+# Precompiled parser for the `# branch.ab +N -M` header emitted by
+# `git status --porcelain=v2 --branch`.
+_BRANCH_AB_RE = re.compile(r"^# branch\.ab \+(\d+) -(\d+)")
+
+# Environment for every git invocation, built once: read-only commands skip
+# index-lock churn, git never blocks on credential prompts, and output is
+# stable utf-8 regardless of the user's locale.
+_GIT_ENV = {
+    **os.environ,
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+    "LC_ALL": "C.UTF-8",
+}
+
+# Public alias for callers outside this module that spawn their own git
+# processes (e.g. the pull in the update flow) and want the same env.
+GIT_ENV = _GIT_ENV
+
+# Minimum seconds between background `git fetch` runs per repository.
+# Manual refreshes bypass this via check_repo_status(force_fetch=True).
+FETCH_MIN_INTERVAL = 120
+
+# Last known upstream ref (e.g. "origin/main") per repo path, remembered so
+# the next fetch can target just that remote instead of `--all`.
+_LAST_UPSTREAM: dict = {}
+
+
+def _fetch_args(repo_path: str) -> List[str]:
+    """
+    Build fetch arguments targeting only the upstream remote when known.
+
+    Fetching a single remote with --no-tags over protocol v2 moves far
+    fewer bytes than `fetch --all` on tag-heavy repos; fall back to
+    `--all` until an upstream has been observed.
+    """
+    upstream = _LAST_UPSTREAM.get(repo_path)
+    remote = upstream.split("/", 1)[0] if upstream and "/" in upstream else None
+    base = ["-c", "protocol.version=2", "fetch"]
+    if remote:
+        return base + [remote, "--prune", "--no-tags", "--jobs=4"]
+    return base + ["--all", "--prune"]
+
+
+# Cached RepoStatus per repo path, keyed on the mtimes of the .git files
+# that change whenever branch, index or remote state changes. Guarded by a
+# lock so concurrent refreshes compute the status once and share the result.
+_STATUS_LOCK = threading.Lock()
+_STATUS_CACHE: dict = {}
+
+
+def resolve_git_dir(repo_path: str) -> str:
+    """
+    Return the repository's git directory. For worktrees and submodules
+    '.git' is a regular file containing 'gitdir: <path>'; otherwise the
+    directory itself is returned.
+    """
+    dot_git = os.path.join(repo_path, ".git")
+    try:
+        if os.path.isfile(dot_git):
+            with open(dot_git) as fh:
+                line = fh.readline().strip()
+            if line.startswith("gitdir:"):
+                target = line[len("gitdir:"):].strip()
+                if not os.path.isabs(target):
+                    target = os.path.normpath(os.path.join(repo_path, target))
+                return target
+    except Exception:
+        pass
+    return dot_git
+
+
+def _status_cache_key(repo_path: str) -> Tuple[int, ...]:
+    """
+    Fingerprint of the repository state relevant to RepoStatus.
+
+    Stats go through the resolved git dir so worktree/submodule repos
+    (regular-file .git) yield real mtimes; a naive <repo>/.git join would
+    make the key a constant and pin the cache forever.
+    """
+    gitdir = resolve_git_dir(repo_path)
+    key = []
+    for name in ("HEAD", "index", "FETCH_HEAD", "packed-refs"):
+        try:
+            key.append(os.stat(os.path.join(gitdir, name)).st_mtime_ns)
+        except OSError:
+            key.append(0)
+    return tuple(key)
+
+
+# Repos whose partial-clone config was written this session; the git config
+# calls only need to run once per repo.
+_PARTIAL_CLONE_DONE: set = set()
+
+
+def _ensure_partial_clone_config(repo_path: str) -> None:
+    """
+    Write the partial-clone fetch config once per repo per session.
+
+    Marks origin as a promisor remote with a blob:none filter and switches
+    fetch negotiation to the 'skipping' algorithm, so fetches skip
+    historical blobs the user never checks out. Only called when the
+    'partial_clone' setting is enabled.
+    """
+    if repo_path in _PARTIAL_CLONE_DONE:
+        return
+    _PARTIAL_CLONE_DONE.add(repo_path)
+    for args in (
+        ["config", "fetch.negotiationAlgorithm", "skipping"],
+        ["config", "remote.origin.promisor", "true"],
+        ["config", "remote.origin.partialclonefilter", "blob:none"],
+    ):
+        run_git(args, repo_path)
+
+
+def _fetch_stamp_path(repo_path: str) -> str:
+    """
+    Path of the per-repo stamp file whose mtime records the last fetch.
+
+    The filename uses a stable digest of the repo path: built-in hash()
+    is randomized per process, which would orphan one stamp per session
+    and lose the throttle across restarts.
+    """
+    digest = hashlib.sha1(repo_path.encode("utf-8", "surrogatepass")).hexdigest()
+    return os.path.join(SETTINGS_DIR, f"last_fetch_{digest}")
+
+
+def _should_fetch(repo_path: str) -> bool:
+    """
+    Returns:
+        bool: True if no fetch happened within FETCH_MIN_INTERVAL.
+
+    Uses the per-repo stamp file, falling back to .git/FETCH_HEAD's mtime
+    when the stamp is missing (first run, cleared config dir) so fetches
+    done outside this app still count against the throttle.
+    """
+    now = time.time()
+    try:
+        st = os.stat(_fetch_stamp_path(repo_path))
+        return now - st.st_mtime > FETCH_MIN_INTERVAL
+    except OSError:
+        pass
+    try:
+        st = os.stat(os.path.join(repo_path, ".git", "FETCH_HEAD"))
+        return now - st.st_mtime > FETCH_MIN_INTERVAL
+    except OSError:
+        return True
+
+
+# Public alias: the auto-refresh tick consults the throttle to decide
+# whether a refresh must run even though local git state is unchanged.
+should_fetch = _should_fetch
+
+
+def _mark_fetched(repo_path: str) -> None:
+    """
+    Touch the per-repo fetch stamp file (best-effort).
+    """
+    try:
+        os.makedirs(SETTINGS_DIR, exist_ok=True)
+        path = _fetch_stamp_path(repo_path)
+        with open(path, "a"):
+            pass
+        os.utime(path, None)
+    except OSError:
+        pass
+
 
 @dataclass
 class RepoStatus:
@@ -71,28 +244,99 @@ def run_git(args: List[str], cwd: str, timeout: int = 15) -> Tuple[int, str, str
 
     Resilience:
         - On any exception returns (1, "", str(exc)).
+
+    The working directory is passed as 'git -C <cwd>' instead of Popen's
+    cwd argument, and close_fds stays off: both keep CPython on its
+    posix_spawn fast path, avoiding a fork of the whole GTK process heap
+    for every status/branch probe.
     """
     try:
         cp = subprocess.run(
-            ["git"] + args,
-            cwd=cwd,
+            ["git", "-C", cwd] + args,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=_GIT_ENV,
             timeout=timeout,
+            close_fds=False,
         )
         return cp.returncode, cp.stdout, cp.stderr
     except Exception as exc:  # pragma: no cover - defensive
         return 1, "", str(exc)
 
 
+def _read_head(repo_path: str) -> Optional[str]:
+    """
+    Read the branch name straight from .git/HEAD without spawning git.
+
+    Returns:
+        str|None: Branch name when HEAD is a symbolic ref to refs/heads/,
+                  None for detached HEAD, worktree .git files or read errors.
+    """
+    try:
+        with open(os.path.join(repo_path, ".git", "HEAD")) as fh:
+            head = fh.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/") :]
+    return None
+
+
+def _read_upstream_from_config(repo_path: str, branch: str) -> Optional[str]:
+    """
+    Resolve the tracking ref from .git/config without spawning git.
+
+    Looks up remote/merge in the [branch "<name>"] section. Returns None
+    when the section is absent, the file cannot be parsed, or the remote
+    is not a plain remote name ('.' marks a local-tracking branch and a
+    path/URL remote has no <remote>/<branch> ref either way) — in all of
+    those cases the caller falls back to `git rev-parse @{u}`, which
+    resolves every layout.
+    """
+    want = f'[branch "{branch}"]'
+    remote = merge = None
+    in_section = False
+    try:
+        with open(os.path.join(repo_path, ".git", "config")) as fh:
+            for raw in fh:
+                line = raw.strip()
+                if line.startswith("["):
+                    in_section = line == want
+                elif in_section and "=" in line:
+                    key, value = line.split("=", 1)
+                    key = key.strip()
+                    if key == "remote":
+                        remote = value.strip()
+                    elif key == "merge":
+                        merge = value.strip()
+    except OSError:
+        return None
+    if (
+        remote
+        and remote != "."
+        and "/" not in remote
+        and merge
+        and merge.startswith("refs/heads/")
+    ):
+        return f"{remote}/{merge[len('refs/heads/') :]}"
+    return None
+
+
 def get_branch(cwd: str) -> Optional[str]:
     """
     Get current branch name.
 
+    Reads .git/HEAD in-process when possible; falls back to rev-parse for
+    layouts that file read cannot handle (worktrees).
+
     Returns:
         str|None: Branch name or None if detached or error.
     """
+    branch = _read_head(cwd)
+    if branch:
+        return branch
     rc, out, _ = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd)
     return out.strip() if rc == 0 else None
 
@@ -102,12 +346,17 @@ def get_upstream(cwd: str, branch: Optional[str]) -> Optional[str]:
     Determine upstream remote reference for current branch.
 
     Strategy:
-        - Try rev-parse @{u} which resolves tracking reference.
+        - Parse .git/config for the branch's remote/merge entries.
+        - Else try rev-parse @{u} which resolves tracking reference.
         - If that fails and branch is known, assume 'origin/<branch>'.
 
     Returns:
         str|None: Upstream or None if not found.
     """
+    if branch:
+        upstream = _read_upstream_from_config(cwd, branch)
+        if upstream:
+            return upstream
     rc, out, _ = run_git(
         ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"], cwd
     )
@@ -129,61 +378,197 @@ def get_dirty_count(cwd: str) -> int:
     rc, out, _ = run_git(["status", "--porcelain"], cwd)
     if rc != 0:
         return 0
-    return len([ln for ln in out.splitlines() if ln.strip()])
+    # Porcelain emits exactly one newline-terminated entry per change, so a
+    # newline count replaces the per-line list allocation.
+    return out.count("\n")
+
+
+def get_unmerged_files(cwd: str) -> List[str]:
+    """
+    List paths with unresolved merge conflicts.
+
+    Reads the 'u' entries from one `git status --porcelain=v2` call
+    (untracked files suppressed), replacing the previous
+    `diff --diff-filter=U` spawn. Empty list on error.
+    """
+    rc, out, _ = run_git(
+        ["status", "--porcelain=v2", "--untracked-files=no"], cwd
+    )
+    if rc != 0:
+        return []
+    files: List[str] = []
+    for line in out.splitlines():
+        # u <XY> <sub> <mH> <m1> <m2> <m3> <hH> <h1> <h2> <path>
+        if line.startswith("u "):
+            parts = line.split(" ", 10)
+            if len(parts) == 11:
+                files.append(parts[10])
+    return files
+
+
+def _count_ahead_behind(
+    repo_path: str, upstream: str
+) -> Optional[Tuple[int, int]]:
+    """
+    One rev-list giving (behind, ahead) against upstream, or None on error.
+    """
+    rc, out, _ = run_git(
+        ["rev-list", "--left-right", "--count", f"{upstream}...HEAD"], repo_path
+    )
+    if rc != 0:
+        return None
+    parts = out.split()
+    if len(parts) != 2:
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
 
 
-def check_repo_status(repo_path: str) -> RepoStatus:
+def check_repo_status(repo_path: str, force_fetch: bool = False) -> RepoStatus:
     """
     Build a RepoStatus describing current repository update condition.
 
     Workflow:
         1. Validate path & presence of .git.
-        2. Run 'git fetch --all --prune' (non-fatal if fails).
-        3. Determine branch & upstream.
-        4. Compute behind/ahead counts via rev-list comparisons.
-        5. Count dirty files.
+        2. Fetch the tracked remote (or --all if unknown; non-fatal); background
+           refreshes skip the fetch when one ran within FETCH_MIN_INTERVAL,
+           explicit user refreshes pass force_fetch=True to bypass that.
+        3. Run a single 'git status --porcelain=v2 --branch' and parse
+           branch, upstream, ahead/behind and dirty count from it.
+
+    Results are cached against the mtimes of .git/{HEAD,index,FETCH_HEAD,
+    packed-refs}: a repeat call with an unchanged repository returns the
+    previous snapshot without spawning git. force_fetch bypasses the cache.
 
     Returns:
         RepoStatus: Complete snapshot (ok=False if invalid).
     """
-    if not os.path.isdir(repo_path):
-        return RepoStatus(
-            ok=False, repo_path=repo_path, error="Repository path not found"
-        )
-    if not os.path.isdir(os.path.join(repo_path, ".git")):
+    # Single stat of <repo>/.git covers both validations; a regular file is
+    # fine too (worktrees and submodules use a .git file pointing elsewhere).
+    try:
+        st = os.stat(os.path.join(repo_path, ".git"))
+    except OSError:
+        if not os.path.isdir(repo_path):
+            return RepoStatus(
+                ok=False, repo_path=repo_path, error="Repository path not found"
+            )
+        return RepoStatus(ok=False, repo_path=repo_path, error="Not a git repository")
+    if not (stat.S_ISDIR(st.st_mode) or stat.S_ISREG(st.st_mode)):
         return RepoStatus(ok=False, repo_path=repo_path, error="Not a git repository")
 
+    with _STATUS_LOCK:
+        if not force_fetch:
+            # A cache hit must not swallow a due background fetch: local
+            # mtimes stay frozen on an idle repo, so without the throttle
+            # check upstream commits would never be discovered.
+            cached = _STATUS_CACHE.get(repo_path)
+            if (
+                cached is not None
+                and cached[0] == _status_cache_key(repo_path)
+                and not _should_fetch(repo_path)
+            ):
+                return cached[1]
+        status = _compute_repo_status(repo_path, force_fetch)
+        if status.ok:
+            key = _status_cache_key(repo_path)
+            # An all-zero key means no git state file could be statted;
+            # caching on it would return stale data forever.
+            if any(key):
+                _STATUS_CACHE[repo_path] = (key, status)
+        return status
+
+
+def _compute_repo_status(repo_path: str, force_fetch: bool) -> RepoStatus:
+    """
+    Uncached body of check_repo_status; caller holds _STATUS_LOCK.
+    """
+    # Start the network-bound fetch in the background and do the local
+    # porcelain read while it runs; branch/upstream/dirty do not depend on
+    # the fetched refs, and the counts are re-derived afterwards.
+    fetch_proc = None
     fetch_error = None
-    rc, _out, err = run_git(["fetch", "--all", "--prune"], repo_path)
-    if rc != 0:
-        fetch_error = (err or "fetch failed").strip()
-
-    branch = get_branch(repo_path)
-    upstream = get_upstream(repo_path, branch)
+    if force_fetch or _should_fetch(repo_path):
+        if bool(SETTINGS.get("partial_clone", False)):
+            _ensure_partial_clone_config(repo_path)
+        try:
+            fetch_proc = subprocess.Popen(
+                ["git", "-C", repo_path] + _fetch_args(repo_path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding="utf-8",
+                errors="replace",
+                env=_GIT_ENV,
+                close_fds=False,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            fetch_error = str(exc)
 
+    branch: Optional[str] = None
+    upstream: Optional[str] = None
     behind = 0
     ahead = 0
-    if upstream:
-        # Count commits present in upstream but not local
-        rc_b, out_b, _ = run_git(
-            ["rev-list", "--count", f"HEAD..{upstream}"], repo_path
-        )
-        if rc_b == 0:
-            try:
-                behind = int((out_b or "").strip() or "0")
-            except ValueError:
-                behind = 0
-        # Count commits present locally but not upstream
-        rc_a, out_a, _ = run_git(
-            ["rev-list", "--count", f"{upstream}..HEAD"], repo_path
-        )
-        if rc_a == 0:
+    dirty = 0
+
+    # When the user never touches the working tree, skip the untracked-file
+    # walk — the expensive part of status on big repos. Branch headers still
+    # need the one status call; dirty is simply not counted.
+    track_dirty = bool(SETTINGS.get("track_dirty", True))
+    status_args = ["status", "--porcelain=v2", "--branch"]
+    if not track_dirty:
+        status_args.append("--untracked-files=no")
+    rc, out, _err = run_git(status_args, repo_path)
+    if rc == 0:
+        for line in out.splitlines():
+            if line.startswith("# "):
+                if line.startswith("# branch.head "):
+                    head = line[len("# branch.head ") :].strip()
+                    branch = head if head != "(detached)" else None
+                elif line.startswith("# branch.upstream "):
+                    upstream = line[len("# branch.upstream ") :].strip() or None
+                    if upstream:
+                        _LAST_UPSTREAM[repo_path] = upstream
+                else:
+                    m = _BRANCH_AB_RE.match(line)
+                    if m:
+                        ahead = int(m.group(1))
+                        behind = int(m.group(2))
+            elif track_dirty and line.strip():
+                dirty += 1
+
+    if upstream is None and branch:
+        # No configured upstream: assume origin/<branch> (matches the old
+        # get_upstream fallback) and get both counts from one rev-list.
+        upstream = f"origin/{branch}"
+        counts = _count_ahead_behind(repo_path, upstream)
+        if counts is None:
+            upstream = None
+        else:
+            behind, ahead = counts
+
+    fetched = False
+    if fetch_proc is not None:
+        try:
+            _out, err = fetch_proc.communicate(timeout=60)
+            if fetch_proc.returncode != 0:
+                fetch_error = (err or "fetch failed").strip()
+            else:
+                _mark_fetched(repo_path)
+                fetched = True
+        except Exception as exc:
             try:
-                ahead = int((out_a or "").strip() or "0")
-            except ValueError:
-                ahead = 0
-
-    dirty = get_dirty_count(repo_path)
+                fetch_proc.kill()
+            except Exception:
+                pass
+            fetch_error = str(exc)
+
+    if fetched and upstream:
+        # The porcelain counts were read while the fetch was in flight;
+        # re-derive them against the refs the fetch may have moved.
+        counts = _count_ahead_behind(repo_path, upstream)
+        if counts is not None:
+            behind, ahead = counts
 
     return RepoStatus(
         ok=True,
@@ -198,10 +583,14 @@ def check_repo_status(repo_path: str) -> RepoStatus:
 
 
 __all__ = [
+    "GIT_ENV",
     "RepoStatus",
+    "resolve_git_dir",
     "run_git",
+    "should_fetch",
     "get_branch",
     "get_upstream",
     "get_dirty_count",
+    "get_unmerged_files",
     "check_repo_status",
 ]
@@ -1,5 +1,7 @@
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import gi
 
 gi.require_version("Gtk", "3.0")
@@ -8,9 +10,49 @@ gi.require_version("Pango", "1.0")
 gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import Gtk, Gdk, Pango, GLib, GdkPixbuf
 
-from widgets.avatars import guess_github_avatar
+from widgets.avatars import fetch_avatar_pixbuf, guess_github_avatar
 from helpers.ansi import insert_ansi_formatted
 
+try:
+    from core.app_meta import SETTINGS
+except Exception:
+    SETTINGS = {}
+
+# Above this many commits the per-row reveal animation is skipped and rows
+# are added in batches instead (one 25ms timeout per row does not scale).
+_ANIMATE_MAX_ROWS = 50
+_BATCH_ROWS = 30
+
+# Shared pool for avatar downloads: bounded parallelism instead of one
+# thread per commit row.
+_AVATAR_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="avatar")
+
+# Avatar-background CSS is global; install it once per process.
+_AVATAR_CSS_INSTALLED = False
+
+
+def _install_avatar_css() -> None:
+    global _AVATAR_CSS_INSTALLED
+    if _AVATAR_CSS_INSTALLED:
+        return
+    try:
+        provider = Gtk.CssProvider()
+        provider.load_from_data(b"""
+        .avatar-bg {
+            background-color: #2e3440;
+            border-radius: 9999px;
+            padding: 2px;
+        }
+        """)
+        screen = Gdk.Screen.get_default()
+        if screen:
+            Gtk.StyleContext.add_provider_for_screen(
+                screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            _AVATAR_CSS_INSTALLED = True
+    except Exception:
+        pass
+
 
 def format_ago(iso_str: str) -> str:
     # Expect ISO-like date from git: "YYYY-MM-DD HH:MM:SS +/-HHMM"
@@ -84,14 +126,9 @@ def build_row(c: dict, list_box: Gtk.ListBox) -> Gtk.Widget:
             url = c.get("avatar") or guess_github_avatar(c.get("email", ""))
             if not url:
                 return
-            import urllib.request
-
-            with urllib.request.urlopen(url, timeout=5) as resp:
-                data = resp.read()
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
+            # Cached per URL: repeat dialog opens (and repeat authors)
+            # download each avatar at most once.
+            pixbuf = fetch_avatar_pixbuf(url)
             if pixbuf:
 
                 def set_img():
@@ -101,12 +138,7 @@ def build_row(c: dict, list_box: Gtk.ListBox) -> Gtk.Widget:
                         import cairo
 
                         size = 32
-                        scaled = (
-                            pixbuf.scale_simple(
-                                size, size, GdkPixbuf.InterpType.BILINEAR
-                            )
-                            or pixbuf
-                        )
+                        scaled = pixbuf
                         surface = cairo.ImageSurface(
                             cairo.FORMAT_ARGB32, size, size
                         )
@@ -130,7 +162,7 @@ def build_row(c: dict, list_box: Gtk.ListBox) -> Gtk.Widget:
         except Exception:
             pass
 
-    threading.Thread(target=load_avatar, daemon=True).start()
+    _AVATAR_POOL.submit(load_avatar)
 
     row.show_all()
     return row
@@ -207,61 +239,64 @@ def on_view_changes_quick(window: Gtk.Window, run_git) -> None:
     list_box.set_selection_mode(Gtk.SelectionMode.NONE)
     sw.add(list_box)
 
-    # Apply CSS for rounded avatar backgrounds
-    try:
-        provider = Gtk.CssProvider()
-        provider.load_from_data(b"""
-        .avatar-bg {
-            background-color: #2e3440;
-            border-radius: 9999px;
-            padding: 2px;
-        }
-        """)
-        screen = Gdk.Screen.get_default()
-        if screen:
-            Gtk.StyleContext.add_provider_for_screen(
-                screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-    except Exception:
-        pass
+    # Apply CSS for rounded avatar backgrounds (one-shot)
+    _install_avatar_css()
     dialog.show_all()
 
     commits_data: list[dict] = []
     row_widgets: list[Gtk.Widget] = []
 
     def work():
-        rc, out, err = run_git(
-            [
-                "log",
-                "--pretty=format:%H|%h|%an|%ae|%ad|%s",
-                "--date=iso",
-                f"HEAD..{upstream}",
-            ],
-            repo_path,
-        )
-        if rc != 0:
-            commits = None
-            error = err or "Failed to load commits."
-        else:
-            lines = [ln for ln in out.splitlines() if ln.strip()]
-            commits = []
-            for ln in lines:
-                parts = ln.split("|", 5)
-                if len(parts) == 6:
-                    full, short, author, email, date_iso, subject = parts
-                    commits.append(
-                        {
-                            "full": full,
-                            "short": short,
-                            "author": author,
-                            "email": email,
-                            "date": date_iso.split(" ")[0],
-                            "date_iso": date_iso,
-                            "subject": subject,
-                            "avatar": guess_github_avatar(email),
-                        }
-                    )
+        # Commit lists keyed by (HEAD sha, upstream sha): reopening the
+        # dialog with unchanged refs skips the git log entirely.
+        cache = getattr(window, "_commits_cache", None)
+        if cache is None:
+            cache = window._commits_cache = {}
+        key = None
+        rc, out, _ = run_git(["rev-parse", "HEAD", upstream], repo_path)
+        if rc == 0:
+            shas = out.split()
+            if len(shas) == 2:
+                key = (shas[0], shas[1])
+
+        if key is not None and key in cache:
+            commits = cache[key]
             error = None
+        else:
+            rc, out, err = run_git(
+                [
+                    "log",
+                    "--pretty=format:%H|%h|%an|%ae|%ad|%s",
+                    "--date=iso",
+                    f"HEAD..{upstream}",
+                ],
+                repo_path,
+            )
+            if rc != 0:
+                commits = None
+                error = err or "Failed to load commits."
+            else:
+                lines = [ln for ln in out.splitlines() if ln.strip()]
+                commits = []
+                for ln in lines:
+                    parts = ln.split("|", 5)
+                    if len(parts) == 6:
+                        full, short, author, email, date_iso, subject = parts
+                        commits.append(
+                            {
+                                "full": full,
+                                "short": short,
+                                "author": author,
+                                "email": email,
+                                "date": date_iso.split(" ")[0],
+                                "date_iso": date_iso,
+                                "subject": subject,
+                                "avatar": guess_github_avatar(email),
+                            }
+                        )
+                error = None
+                if key is not None:
+                    cache[key] = commits
 
         def done():
             if error:
@@ -284,13 +319,18 @@ def on_view_changes_quick(window: Gtk.Window, run_git) -> None:
 
             index = {"i": 0}
 
+            def finish_population():
+                # Enable search if many
+                if len(commits_data) > 15:
+                    search_entry.show()
+                    search_entry.connect(
+                        "changed", lambda e: apply_filter(e, list_box, commits_data)
+                    )
+
             def add_next():
                 i = index["i"]
                 if i >= len(commits_data):
-                    # Enable search if many
-                    if len(commits_data) > 15:
-                        search_entry.show()
-                        search_entry.connect("changed", lambda e: apply_filter(e, list_box, commits_data))
+                    finish_population()
                     return False
                 c = commits_data[i]
                 index["i"] = i + 1
@@ -317,8 +357,28 @@ def on_view_changes_quick(window: Gtk.Window, run_git) -> None:
                 GLib.timeout_add(25, add_next)
                 return False
 
-            # Kick off incremental rendering
-            GLib.idle_add(add_next)
+            def add_batch():
+                i = index["i"]
+                if i >= len(commits_data):
+                    finish_population()
+                    return False
+                for c in commits_data[i : i + _BATCH_ROWS]:
+                    row = build_row(c, list_box)
+                    list_box.add(row)
+                    row_widgets.append(row)
+                index["i"] = i + _BATCH_ROWS
+                list_box.show_all()
+                # Keep this idle source alive until all rows are in
+                return True
+
+            # Kick off incremental rendering: animate small lists, batch
+            # big ones so a 500-commit diff fills in a few ticks instead
+            # of one row per 25ms.
+            animate = bool(SETTINGS.get("changes_lazy_load", True))
+            if animate and len(commits_data) <= _ANIMATE_MAX_ROWS:
+                GLib.idle_add(add_next)
+            else:
+                GLib.idle_add(add_batch)
             return False
 
         GLib.idle_add(done)
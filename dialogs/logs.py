@@ -2,22 +2,21 @@ import time
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
+
+# Details bodies above this size are inserted in slices after the dialog
+# maps, instead of one huge set_text that stalls the open animation.
+_CHUNK_CHARS = 65536
 
 
 def show_logs_dialog(window) -> None:
-    if not window._update_logs:
+    if not window._log_ts:
         show_details_dialog(window, "Git Logs", "No update logs yet.", "")
         return
-    brief_lines = [
-        f"{ts} | {event} | {summary.splitlines()[0] if summary else ''}"
-        for (ts, event, summary) in window._update_logs
-    ]
-    brief_body = "\n".join(brief_lines)
-    expanded = "\n\n----\n\n".join(
-        f"{ts}\nEvent: {event}\n{summary}"
-        for (ts, event, summary) in window._update_logs
-    )
+    # Both bodies are preformatted incrementally by _add_log; opening the
+    # dialog is just a join over the cached per-entry strings.
+    brief_body = "\n".join(window._log_brief)
+    expanded = "\n\n----\n\n".join(window._log_expanded)
     show_details_dialog(window, "Update Logs", brief_body, expanded)
 
 
@@ -44,7 +43,26 @@ def show_details_dialog(
     tv.set_editable(False)
     tv.set_cursor_visible(False)
     buf = tv.get_buffer()
-    buf.set_text(details or "(no details)")
+    text = details or "(no details)"
+    if len(text) <= _CHUNK_CHARS:
+        buf.set_text(text)
+    else:
+        state = {"i": 0, "started": False}
+
+        def insert_chunk() -> bool:
+            i = state["i"]
+            if i >= len(text):
+                return False
+            buf.insert(buf.get_end_iter(), text[i : i + _CHUNK_CHARS])
+            state["i"] = i + _CHUNK_CHARS
+            return True
+
+        def on_mapped(_w) -> None:
+            if not state["started"]:
+                state["started"] = True
+                GLib.idle_add(insert_chunk)
+
+        tv.connect("map", on_mapped)
 
     sw.add(tv)
     box.pack_start(sw, True, True, 0)
@@ -5,6 +5,33 @@ import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gdk, Gtk
 
+# Separator-row CSS is global; install it once per process, not per dialog.
+_SEP_CSS_INSTALLED = False
+
+
+def _install_separator_css() -> None:
+    global _SEP_CSS_INSTALLED
+    if _SEP_CSS_INSTALLED:
+        return
+    provider = Gtk.CssProvider()
+    provider.load_from_data(
+        b"""
+        .separator-row {
+            background: transparent;
+        }
+        .separator-row:hover,
+        .separator-row:active {
+            background: transparent;
+        }
+        """
+    )
+    Gtk.StyleContext.add_provider_for_screen(
+        Gdk.Screen.get_default(),
+        provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
+    _SEP_CSS_INSTALLED = True
+
 
 def show_settings_dialog(
     window, SETTINGS, REPO_PATH, AUTO_REFRESH_SECONDS, _save_settings
@@ -37,26 +64,7 @@ def show_settings_dialog(
     outer.pack_start(listbox, True, True, 0)
 
     def separator() -> None:
-        # Install CSS for separator rows once
-        if not getattr(listbox, "_sep_css_added", False):
-            provider = Gtk.CssProvider()
-            provider.load_from_data(
-                b"""
-                .separator-row {
-                    background: transparent;
-                }
-                .separator-row:hover,
-                .separator-row:active {
-                    background: transparent;
-                }
-                """
-            )
-            Gtk.StyleContext.add_provider_for_screen(
-                Gdk.Screen.get_default(),
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-            listbox._sep_css_added = True
+        _install_separator_css()
         row = Gtk.ListBoxRow()
         # Disable hover/selection/activation effects
         row.set_activatable(False)
@@ -147,6 +155,22 @@ def show_settings_dialog(
     cb_detached.set_active(bool(SETTINGS.get("detached_console", False)))
     setting("Detached installer console", cb_detached)
 
+    cb_dirty = Gtk.CheckButton.new_with_label("Track local changes")
+    cb_dirty.set_active(bool(SETTINGS.get("track_dirty", True)))
+    setting(
+        "Track local changes",
+        cb_dirty,
+        "Count modified/untracked files on refresh. Turn off to skip the worktree scan if you never edit the repo locally.",
+    )
+
+    cb_partial = Gtk.CheckButton.new_with_label("Use partial clone (less history)")
+    cb_partial.set_active(bool(SETTINGS.get("partial_clone", False)))
+    setting(
+        "Partial clone fetches",
+        cb_partial,
+        "Configure the repo so fetches skip historical file contents (blob:none filter). Cuts bandwidth on large repos.",
+    )
+
     # BETA (keep fish config)
     cb_keep_fish = Gtk.CheckButton.new_with_label("Keep fish config (beta)")
     cb_keep_fish.set_active(bool(SETTINGS.get("keep_fish_config", False)))
@@ -262,6 +286,8 @@ def show_settings_dialog(
         SETTINGS["show_details_button"] = cb_details_btn.get_active()
         SETTINGS["post_script_path"] = entry_post.get_text().strip()
         SETTINGS["keep_fish_config"] = cb_keep_fish.get_active()
+        SETTINGS["track_dirty"] = cb_dirty.get_active()
+        SETTINGS["partial_clone"] = cb_partial.get_active()
         _save_settings(SETTINGS)
         REPO_PATH = str(SETTINGS.get("repo_path") or "")
         AUTO_REFRESH_SECONDS = int(
@@ -272,5 +298,11 @@ def show_settings_dialog(
                 window.header_bar.props.subtitle = REPO_PATH
             except Exception:
                 pass
+        # Consoles cache hot-path settings (log limit); let them re-read
+        try:
+            if hasattr(window, "console"):
+                window.console.refresh_settings()
+        except Exception:
+            pass
         window.refresh_status()
     dialog.destroy()
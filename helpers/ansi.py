@@ -5,6 +5,82 @@ gi.require_version("Gtk", "3.0")
 gi.require_version("Pango", "1.0")
 from gi.repository import Gtk, Pango
 
+# Compiled grammar and tag/color tables, built once at import time so each
+# append only pays for the scan itself (not re-building these per call).
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+_BASE_TAGS = {
+    "ansi-bold": lambda t: t.set_property("weight", Pango.Weight.BOLD),
+    "ansi-dim": lambda t: t.set_property("scale", 0.95),
+    "ansi-italic": lambda t: t.set_property("style", Pango.Style.ITALIC),
+    "ansi-underline": lambda t: t.set_property("underline", Pango.Underline.SINGLE),
+    "ansi-red": lambda t: t.set_property("foreground", "#ff5555"),
+    "ansi-green": lambda t: t.set_property("foreground", "#50fa7b"),
+    "ansi-yellow": lambda t: t.set_property("foreground", "#f1fa8c"),
+    "ansi-blue": lambda t: t.set_property("foreground", "#8be9fd"),
+    "ansi-magenta": lambda t: t.set_property("foreground", "#ff79c6"),
+    "ansi-cyan": lambda t: t.set_property("foreground", "#66d9ef"),
+    "ansi-white": lambda t: t.set_property("foreground", "#f8f8f2"),
+    "ansi-bright-black": lambda t: t.set_property("foreground", "#6272a4"),
+    "ansi-bright-red": lambda t: t.set_property("foreground", "#ff6e6e"),
+    "ansi-bright-green": lambda t: t.set_property("foreground", "#69ff94"),
+    "ansi-bright-yellow": lambda t: t.set_property("foreground", "#ffffa5"),
+    "ansi-bright-blue": lambda t: t.set_property("foreground", "#9aedfe"),
+    "ansi-bright-magenta": lambda t: t.set_property("foreground", "#ff92df"),
+    "ansi-bright-cyan": lambda t: t.set_property("foreground", "#82e9ff"),
+    "ansi-bright-white": lambda t: t.set_property("foreground", "#ffffff"),
+}
+
+_SGR_MAP = {
+    "1": "ansi-bold",
+    "2": "ansi-dim",
+    "3": "ansi-italic",
+    "4": "ansi-underline",
+    "30": "ansi-bright-black",
+    "31": "ansi-red",
+    "32": "ansi-green",
+    "33": "ansi-yellow",
+    "34": "ansi-blue",
+    "35": "ansi-magenta",
+    "36": "ansi-cyan",
+    "37": "ansi-white",
+    "90": "ansi-bright-black",
+    "91": "ansi-bright-red",
+    "92": "ansi-bright-green",
+    "93": "ansi-bright-yellow",
+    "94": "ansi-bright-blue",
+    "95": "ansi-bright-magenta",
+    "96": "ansi-bright-cyan",
+    "97": "ansi-bright-white",
+}
+
+_BG_MAP = {
+    "40": "#000000",
+    "41": "#ff5555",
+    "42": "#50fa7b",
+    "43": "#f1fa8c",
+    "44": "#8be9fd",
+    "45": "#ff79c6",
+    "46": "#66d9ef",
+    "47": "#f8f8f2",
+    "100": "#6272a4",
+    "101": "#ff6e6e",
+    "102": "#69ff94",
+    "103": "#ffffa5",
+    "104": "#9aedfe",
+    "105": "#ff92df",
+    "106": "#82e9ff",
+    "107": "#ffffff",
+}
+
+
+def strip_ansi(raw: str) -> str:
+    """
+    Return raw with ANSI SGR sequences removed (no tagging). Cheap path
+    for consumers that want plain text, e.g. a hidden console.
+    """
+    return _ANSI_RE.sub("", raw)
+
 
 def insert_ansi_formatted(buf: Gtk.TextBuffer, raw: str) -> None:
     """
@@ -16,76 +92,13 @@ def insert_ansi_formatted(buf: Gtk.TextBuffer, raw: str) -> None:
     - Apply tags using iter ranges (no stored iter reused across buffer mutations).
     """
     # Ensure base tags exist
-    base_tags = {
-        "ansi-bold": lambda t: t.set_property("weight", Pango.Weight.BOLD),
-        "ansi-dim": lambda t: t.set_property("scale", 0.95),
-        "ansi-italic": lambda t: t.set_property("style", Pango.Style.ITALIC),
-        "ansi-underline": lambda t: t.set_property("underline", Pango.Underline.SINGLE),
-        "ansi-red": lambda t: t.set_property("foreground", "#ff5555"),
-        "ansi-green": lambda t: t.set_property("foreground", "#50fa7b"),
-        "ansi-yellow": lambda t: t.set_property("foreground", "#f1fa8c"),
-        "ansi-blue": lambda t: t.set_property("foreground", "#8be9fd"),
-        "ansi-magenta": lambda t: t.set_property("foreground", "#ff79c6"),
-        "ansi-cyan": lambda t: t.set_property("foreground", "#66d9ef"),
-        "ansi-white": lambda t: t.set_property("foreground", "#f8f8f2"),
-        "ansi-bright-black": lambda t: t.set_property("foreground", "#6272a4"),
-        "ansi-bright-red": lambda t: t.set_property("foreground", "#ff6e6e"),
-        "ansi-bright-green": lambda t: t.set_property("foreground", "#69ff94"),
-        "ansi-bright-yellow": lambda t: t.set_property("foreground", "#ffffa5"),
-        "ansi-bright-blue": lambda t: t.set_property("foreground", "#9aedfe"),
-        "ansi-bright-magenta": lambda t: t.set_property("foreground", "#ff92df"),
-        "ansi-bright-cyan": lambda t: t.set_property("foreground", "#82e9ff"),
-        "ansi-bright-white": lambda t: t.set_property("foreground", "#ffffff"),
-    }
     tag_table = buf.get_tag_table()
-    for name, init in base_tags.items():
+    for name, init in _BASE_TAGS.items():
         if tag_table.lookup(name) is None:
             tg = Gtk.TextTag.new(name)
             init(tg)
             tag_table.add(tg)
 
-    sgr_map = {
-        "1": "ansi-bold",
-        "2": "ansi-dim",
-        "3": "ansi-italic",
-        "4": "ansi-underline",
-        "30": "ansi-bright-black",
-        "31": "ansi-red",
-        "32": "ansi-green",
-        "33": "ansi-yellow",
-        "34": "ansi-blue",
-        "35": "ansi-magenta",
-        "36": "ansi-cyan",
-        "37": "ansi-white",
-        "90": "ansi-bright-black",
-        "91": "ansi-bright-red",
-        "92": "ansi-bright-green",
-        "93": "ansi-bright-yellow",
-        "94": "ansi-bright-blue",
-        "95": "ansi-bright-magenta",
-        "96": "ansi-bright-cyan",
-        "97": "ansi-bright-white",
-    }
-    bg_map = {
-        "40": "#000000",
-        "41": "#ff5555",
-        "42": "#50fa7b",
-        "43": "#f1fa8c",
-        "44": "#8be9fd",
-        "45": "#ff79c6",
-        "46": "#66d9ef",
-        "47": "#f8f8f2",
-        "100": "#6272a4",
-        "101": "#ff6e6e",
-        "102": "#69ff94",
-        "103": "#ffffa5",
-        "104": "#9aedfe",
-        "105": "#ff92df",
-        "106": "#82e9ff",
-        "107": "#ffffff",
-    }
-
-    ansi_re = re.compile(r"\x1b\[[0-9;]*m")
     pos = 0
     active = []
 
@@ -134,7 +147,7 @@ def insert_ansi_formatted(buf: Gtk.TextBuffer, raw: str) -> None:
         return name
 
     while True:
-        m = ansi_re.search(raw, pos)
+        m = _ANSI_RE.search(raw, pos)
         segment = raw[pos : m.start()] if m else raw[pos:]
         if segment:
             # compute offsets to avoid invalid iterators
@@ -165,14 +178,14 @@ def insert_ansi_formatted(buf: Gtk.TextBuffer, raw: str) -> None:
                         pass
                     i += 3
                     continue
-                mapped = sgr_map.get(c)
+                mapped = _SGR_MAP.get(c)
                 if mapped and mapped not in active:
                     active.append(mapped)
-                elif c in bg_map:
+                elif c in _BG_MAP:
                     name = f"ansi-bg-{c}"
                     if tag_table.lookup(name) is None:
                         tg = Gtk.TextTag.new(name)
-                        tg.set_property("background", bg_map[c])
+                        tg.set_property("background", _BG_MAP[c])
                         tag_table.add(tg)
                     if name not in active:
                         active.append(name)
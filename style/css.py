@@ -32,4 +32,44 @@ def get_css() -> str:
     .ansi-bright-magenta { color: #ff92df; }
     .ansi-bright-cyan { color: #82e9ff; }
     .ansi-bright-white { color: #ffffff; }
+    .setup-console {
+        font-size: 12px;
+        line-height: 1.25;
+    }
+    """
+
+
+# Set once install_app_css succeeds; keeps repeat callers from stacking
+# duplicate global providers on the screen.
+_CSS_INSTALLED = False
+
+
+def install_app_css() -> bool:
+    """
+    Install the application CSS on the default screen exactly once.
+
+    Every widget that relies on the shared style classes may call this;
+    only the first call creates and registers a provider, later calls are
+    no-ops. Returns True when the CSS is installed (now or previously).
     """
+    global _CSS_INSTALLED
+    if _CSS_INSTALLED:
+        return True
+    try:
+        import gi
+
+        gi.require_version("Gtk", "3.0")
+        gi.require_version("Gdk", "3.0")
+        from gi.repository import Gdk, Gtk
+
+        provider = Gtk.CssProvider()
+        provider.load_from_data(get_css().encode("utf-8"))
+        screen = Gdk.Screen.get_default()
+        if screen:
+            Gtk.StyleContext.add_provider_for_screen(
+                screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            _CSS_INSTALLED = True
+    except Exception:
+        pass
+    return _CSS_INSTALLED
@@ -34,6 +34,7 @@ from __future__ import annotations
 
 import os
 import threading
+from collections import deque
 from typing import Callable, Optional
 
 import gi
@@ -44,14 +45,15 @@ from gi.repository import Gdk, GLib, Gtk
 
 # Local imports (kept optional/defensive where possible)
 try:
-    from style.css import get_css  # type: ignore
+    from style.css import install_app_css  # type: ignore
 except Exception:  # pragma: no cover - defensive
-    get_css = None  # type: ignore[assignment]
+    install_app_css = None  # type: ignore[assignment]
 
 try:
-    from helpers.ansi import insert_ansi_formatted  # type: ignore
+    from helpers.ansi import insert_ansi_formatted, strip_ansi  # type: ignore
 except Exception:  # pragma: no cover - defensive
     insert_ansi_formatted = None  # type: ignore[assignment]
+    strip_ansi = None  # type: ignore[assignment]
 
 
 class ConsolePanel:
@@ -69,6 +71,18 @@ class ConsolePanel:
         self.settings = settings or {}
         self._current_proc = None
 
+        # Pending append batching: producer threads push chunks here and a
+        # single 50ms main-loop timeout drains them with one buffer insert.
+        self._pending: deque = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Rolling newline count; trimming uses it instead of asking the
+        # buffer to recount lines on every flush.
+        self._line_count = 0
+        # Hot-path settings cached as typed attributes so the flush tick
+        # does no dict probe/int() work; refresh_settings() re-reads them.
+        self._log_max_lines = self._read_log_limit()
+
         # Revealer root
         self.revealer = Gtk.Revealer()
         self.revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
@@ -113,6 +127,11 @@ class ConsolePanel:
         self._apply_css()
 
         self.buffer = self.view.get_buffer()
+        # One left-gravity=False (right-gravity) mark riding the buffer end;
+        # each flush scrolls to it instead of allocating a new mark.
+        self._end_mark = self.buffer.create_mark(
+            None, self.buffer.get_end_iter(), False
+        )
 
         sw = Gtk.ScrolledWindow()
         sw.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
@@ -157,6 +176,18 @@ class ConsolePanel:
         except Exception:
             pass
 
+    def refresh_settings(self) -> None:
+        """
+        Re-read cached settings values (call after the settings dialog saves).
+        """
+        self._log_max_lines = self._read_log_limit()
+
+    def _read_log_limit(self) -> int:
+        try:
+            return int(self.settings.get("log_max_lines", 0))
+        except Exception:
+            return 0
+
     def toggle(self) -> None:
         """
         Toggle the revealer visibility.
@@ -184,21 +215,65 @@ class ConsolePanel:
 
     def append(self, text: str) -> None:
         """
-        Append text to the console buffer (thread-safe).
+        Queue text for the console buffer (thread-safe).
+
+        Appends are coalesced: chunks pile up in a deque and a single 50ms
+        main-loop timeout drains them with one insert, so bursty subprocess
+        output costs one TextView update per tick instead of one idle_add
+        round-trip per chunk.
+        """
+        with self._pending_lock:
+            self._pending.append(text)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        GLib.timeout_add(50, self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        """
+        Drain all queued chunks into the buffer (main loop only).
         Applies ANSI styling if available; otherwise inserts plain text.
         Enforces optional line limit from settings.
         """
+        with self._pending_lock:
+            if not self._pending:
+                self._flush_scheduled = False
+                return False
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
 
-        def do_append() -> bool:
-            buf = getattr(self, "buffer", None)
-            view = getattr(self, "view", None)
-            if not buf or not view:
+        buf = getattr(self, "buffer", None)
+        view = getattr(self, "view", None)
+        if not buf or not view:
+            return False
+        try:
+            # While the console is collapsed or unrealized, skip ANSI
+            # tagging and scrolling entirely: insert stripped plain text so
+            # the buffer stays complete without paying the GTK hot paths
+            # nobody can see.
+            hidden = not view.get_realized() or not self.revealer.get_reveal_child()
+            if hidden:
+                buf.insert(
+                    buf.get_end_iter(),
+                    strip_ansi(text) if strip_ansi else text,
+                )
+                self._line_count += text.count("\n")
+                try:
+                    limit = self._log_max_lines
+                    if limit and self._line_count > limit + 512:
+                        excess = self._line_count - limit
+                        buf.delete(
+                            buf.get_start_iter(), buf.get_iter_at_line(excess)
+                        )
+                        self._line_count = limit
+                except Exception:
+                    pass
                 return False
+            # Group the insert and trim into one user action so the buffer
+            # emits a single begin/end signal pair per batch.
+            buf.begin_user_action()
             try:
-                # If unrealized, do a simple insert (no scroll)
-                if not view.get_realized():
-                    buf.insert(buf.get_end_iter(), text)
-                    return False
                 try:
                     if insert_ansi_formatted:
                         insert_ansi_formatted(buf, text)
@@ -206,30 +281,30 @@ class ConsolePanel:
                         buf.insert(buf.get_end_iter(), text)
                 except Exception:
                     buf.insert(buf.get_end_iter(), text)
+                self._line_count += text.count("\n")
 
-                # Scroll to end when visible
-                if view.get_visible() and view.get_realized():
-                    end_it = buf.get_end_iter()
-                    mark = buf.create_mark(None, end_it, False)
-                    view.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
-
-                # Optional trimming
+                # Optional trimming, ring-buffer style: let the buffer run
+                # a block past the limit, then cut the excess in one
+                # batched delete so most flushes never touch the front.
                 try:
-                    limit = int(self.settings.get("log_max_lines", 0))
-                    if limit and buf.get_line_count() > limit:
+                    limit = self._log_max_lines
+                    if limit and self._line_count > limit + 512:
+                        excess = self._line_count - limit
                         start_it = buf.get_start_iter()
-                        end_it = buf.get_iter_at_line(buf.get_line_count() - limit)
+                        end_it = buf.get_iter_at_line(excess)
                         buf.delete(start_it, end_it)
+                        self._line_count = limit
                 except Exception:
                     pass
-            except Exception:
-                pass
-            return False
+            finally:
+                buf.end_user_action()
 
-        if threading.current_thread() is threading.main_thread():
-            do_append()
-        else:
-            GLib.idle_add(do_append)
+            # Scroll once per batch when visible
+            if view.get_visible() and view.get_realized():
+                view.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
+        except Exception:
+            pass
+        return False
 
     def clear(self) -> None:
         """
@@ -238,8 +313,11 @@ class ConsolePanel:
 
         def do_clear() -> bool:
             try:
+                with self._pending_lock:
+                    self._pending.clear()
                 if hasattr(self, "buffer"):
                     self.buffer.set_text("")
+                self._line_count = 0
             except Exception:
                 pass
             return False
@@ -306,18 +384,11 @@ class ConsolePanel:
     # ------------------------------------------------------------------
     def _apply_css(self) -> None:
         """
-        Apply application CSS for the log view if available and add 'log-view' style.
+        Ensure the shared app CSS is installed and tag the view 'log-view'.
         """
         try:
-            css_text = get_css() if get_css else None
-            if css_text:
-                provider = Gtk.CssProvider()
-                provider.load_from_data(css_text.encode("utf-8"))
-                screen = Gdk.Screen.get_default()
-                if screen:
-                    Gtk.StyleContext.add_provider_for_screen(
-                        screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
+            if install_app_css:
+                install_app_css()
             # Always tag the view for rules to match
             try:
                 self.view.get_style_context().add_class("log-view")
@@ -11,20 +11,22 @@ Refactored MainWindow implementation using modular helpers.
 
 from __future__ import annotations
 
+import functools
 import os
 import shlex
 import shutil
+import stat
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import gi
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
-gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import Gdk, GdkPixbuf, Gio, GLib, Gtk, Pango
+from gi.repository import Gdk, Gio, GLib, Gtk, Pango
 
 # App metadata and settings
 from core.app_meta import (
@@ -40,11 +42,15 @@ from core.app_meta import (
 
 # Git utilities
 from core.git_utils import (
+    GIT_ENV,
     RepoStatus,
     check_repo_status,
     get_branch,
+    get_unmerged_files,
     get_upstream,
+    resolve_git_dir as _resolve_git_dir,
     run_git,
+    should_fetch,
 )
 
 # Dialogs
@@ -59,11 +65,100 @@ from ui.console_panel import ConsolePanel
 
 # Process helpers
 from utils.process import (
+    drain_process_output as _drain_process_output,
     spawn_setup_install as _spawn_setup_install,
 )
 
-# Optional external console widget
-from widgets.console import SetupConsole
+# The external console widget (widgets.console) is imported lazily in
+# run_install_external: it is only needed for detached installs and keeping
+# it off the import path shortens startup.
+
+# Static template for the details label; formatted in one pass per refresh
+# so the label gets a single set_text (one layout invalidation).
+_DETAILS_FMT = (
+    "Repo: {repo}\n"
+    "Branch: {branch}\n"
+    "Upstream: {upstream}\n"
+    "Status: {changes}\n"
+    "Sync: {ahead}, {behind}"
+)
+
+
+def _is_executable(path: str) -> bool:
+    """
+    True when path is a regular file with any execute bit set. One stat
+    call instead of the isfile + access pair.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(
+        st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    )
+
+
+def _git_state_mtimes(repo_path: str) -> tuple:
+    """
+    Snapshot the mtimes of the git files that change whenever the repo
+    state does (HEAD, FETCH_HEAD, packed-refs, index). Missing files are
+    recorded as None so their appearance also counts as a change.
+    """
+    if not repo_path:
+        return ()
+    git_dir = _resolve_git_dir(repo_path)
+    out = []
+    for name in ("HEAD", "FETCH_HEAD", "packed-refs", "index"):
+        try:
+            out.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_icon_assets():
+    """
+    Discover the app icon and scale it to the standard sizes, once per
+    process. Returns (source_path, icon_list); (None, []) when no icon
+    file is found.
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    candidates = [
+        "/usr/share/icons/hicolor/256x256/apps/illogical-updots.png",
+        "/usr/share/icons/hicolor/128x128/apps/illogical-updots.png",
+        "/usr/share/icons/hicolor/64x64/apps/illogical-updots.png",
+        "/usr/share/icons/hicolor/48x48/apps/illogical-updots.png",
+        "/usr/share/icons/hicolor/32x32/apps/illogical-updots.png",
+        "/usr/share/icons/hicolor/16x16/apps/illogical-updots.png",
+        "/usr/share/pixmaps/illogical-updots.png",
+        os.path.join(base_dir, "..", ".github", "assets", "logo.png"),
+        os.path.join(base_dir, "..", "assets", "logo.png"),
+    ]
+    candidates = [
+        os.path.abspath(os.path.join(base_dir, p)) if not p.startswith("/") else p
+        for p in candidates
+    ]
+    src = next((p for p in candidates if os.path.isfile(p)), None)
+    if not src:
+        return None, []
+    icon_list = []
+    try:
+        # Deferred so GdkPixbuf is not loaded during module import
+        gi.require_version("GdkPixbuf", "2.0")
+        from gi.repository import GdkPixbuf
+
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file(src)
+        for s in (16, 24, 32, 48, 64, 96, 128, 256):
+            try:
+                icon_list.append(
+                    pixbuf.scale_simple(s, s, GdkPixbuf.InterpType.BILINEAR)
+                )
+            except Exception:
+                continue
+    except Exception:
+        pass
+    return src, icon_list
 
 
 class MainWindow(Gtk.ApplicationWindow):
@@ -78,11 +173,49 @@ class MainWindow(Gtk.ApplicationWindow):
 
     Behavior:
       - Asynchronous repo status refresh with periodic auto-refresh
-      - Update flow: stash -> pull (rebase/autostash) -> installer
+      - Update flow: pull (rebase/autostash) -> installer
       - Optional external terminal for full installer
       - Ctrl+I: run files-only installer shortcut (no pull)
     """
 
+    # Header menu shared across windows; built lazily on first use.
+    _MENU = None
+
+    # Static banner markup, built once; only the behind-count line is dynamic.
+    _MKUP_ERROR = (
+        "<span size='xx-large' weight='bold' foreground='red'>Repository error</span>"
+    )
+    _MKUP_UP_TO_DATE = "<span size='xx-large' weight='bold'>Up to date</span>"
+    _MKUP_UPDATES = (
+        "<span size='xx-large' weight='bold'>Updates available</span>\n"
+        "<span size='large'>{behind} new commit(s) to pull</span>"
+    )
+
+    @classmethod
+    def _get_menu(cls, window) -> Gtk.Menu:
+        """
+        Build the static header menu once and reuse it for later windows.
+
+        The item handlers bind to the first window that builds the menu;
+        this app is single-instance so that window is the only one.
+        """
+        if cls._MENU is None:
+            menu = Gtk.Menu()
+            mi_settings = Gtk.MenuItem(label="Settings")
+            mi_settings.connect("activate", window.on_settings_clicked)
+            menu.append(mi_settings)
+
+            mi_logs = Gtk.MenuItem(label="Git Logs")
+            mi_logs.connect("activate", window.on_logs_clicked)
+            menu.append(mi_logs)
+
+            mi_about = Gtk.MenuItem(label="About")
+            mi_about.connect("activate", window.on_about_clicked)
+            menu.append(mi_about)
+            menu.show_all()
+            cls._MENU = menu
+        return cls._MENU
+
     def __init__(self, app: Gtk.Application) -> None:
         super().__init__(application=app, title=APP_TITLE)
         self.set_default_size(520, 280)
@@ -119,23 +252,9 @@ class MainWindow(Gtk.ApplicationWindow):
         )
 
         # Menu
-        menu = Gtk.Menu()
-        mi_settings = Gtk.MenuItem(label="Settings")
-        mi_settings.connect("activate", self.on_settings_clicked)
-        menu.append(mi_settings)
-
-        mi_logs = Gtk.MenuItem(label="Git Logs")
-        mi_logs.connect("activate", self.on_logs_clicked)
-        menu.append(mi_logs)
-
-        mi_about = Gtk.MenuItem(label="About")
-        mi_about.connect("activate", self.on_about_clicked)
-        menu.append(mi_about)
-        menu.show_all()
-
         menu_btn = Gtk.MenuButton()
         menu_btn.set_tooltip_text("Menu")
-        menu_btn.set_popup(menu)
+        menu_btn.set_popup(self._get_menu(self))
         menu_btn.set_image(
             Gtk.Image.new_from_icon_name("open-menu-symbolic", Gtk.IconSize.BUTTON)
         )
@@ -227,13 +346,37 @@ class MainWindow(Gtk.ApplicationWindow):
 
         # State
         self._status: Optional[RepoStatus] = None
-        self._update_logs: list[tuple[str, str, str]] = []
+        # Update log storage as parallel arrays (SoA): the brief list view only
+        # needs timestamps/events, so the potentially large details strings are
+        # never touched until the expanded body is built.
+        self._log_ts: list[str] = []
+        self._log_event: list[str] = []
+        self._log_details: list[str] = []
+        # Preformatted dialog bodies, appended alongside the raw arrays
+        self._log_brief: list[str] = []
+        self._log_expanded: list[str] = []
         self._busy(False, "")
         self._tray_icon = None
         self._auto_mode_choice: Optional[str] = None
-
-        # Initial + periodic refresh
+        # PATH walk done once; the update path only checks the cached result
+        self._kitty_path = shutil.which("kitty")
+        # Shared worker pool: refresh/update/installer tasks reuse threads
+        # instead of paying thread creation per operation.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="updatify")
+        self.connect("destroy", lambda *_: self._pool.shutdown(wait=False))
+
+        # Initial + periodic refresh. File monitors on the key .git files
+        # react to real changes; the timer stays as a safety net and skips
+        # its tick when a monitor-triggered refresh happened recently.
+        self._last_refresh_ts = 0.0
+        self._last_mtimes: tuple = ()
+        self._refresh_lock = threading.Lock()
+        self._refresh_running = False
+        self._refresh_pending = False
+        self._refresh_pending_force = False
+        self._git_monitors: list = []
         self.refresh_status()
+        self._install_git_monitors()
         GLib.timeout_add_seconds(AUTO_REFRESH_SECONDS, self._auto_refresh)
 
     # Icons
@@ -242,48 +385,23 @@ class MainWindow(Gtk.ApplicationWindow):
             self.set_icon_name("illogical-updots")
         except Exception:
             pass
+        # Defer the pixbuf load/scaling past the first paint; the cached
+        # assets are shared by any later window.
+        GLib.idle_add(self._apply_icon_list)
+
+    def _apply_icon_list(self) -> bool:
         try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            candidates = [
-                "/usr/share/icons/hicolor/256x256/apps/illogical-updots.png",
-                "/usr/share/icons/hicolor/128x128/apps/illogical-updots.png",
-                "/usr/share/icons/hicolor/64x64/apps/illogical-updots.png",
-                "/usr/share/icons/hicolor/48x48/apps/illogical-updots.png",
-                "/usr/share/icons/hicolor/32x32/apps/illogical-updots.png",
-                "/usr/share/icons/hicolor/16x16/apps/illogical-updots.png",
-                "/usr/share/pixmaps/illogical-updots.png",
-                os.path.join(base_dir, "..", ".github", "assets", "logo.png"),
-                os.path.join(base_dir, "..", "assets", "logo.png"),
-            ]
-            candidates = [
-                os.path.abspath(os.path.join(base_dir, p))
-                if not p.startswith("/")
-                else p
-                for p in candidates
-            ]
-            src = next((p for p in candidates if os.path.isfile(p)), None)
-            if not src:
-                return
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file(src)
-                sizes = [16, 24, 32, 48, 64, 96, 128, 256]
-                icon_list = []
-                for s in sizes:
-                    try:
-                        icon_list.append(
-                            pixbuf.scale_simple(s, s, GdkPixbuf.InterpType.BILINEAR)
-                        )
-                    except Exception:
-                        continue
-                if icon_list:
-                    self.set_icon_list(icon_list)
-            except Exception:
+            src, icon_list = _get_icon_assets()
+            if icon_list:
+                self.set_icon_list(icon_list)
+            elif src:
                 try:
                     self.set_icon_from_file(src)
                 except Exception:
                     pass
         except Exception:
             pass
+        return False
 
     # Busy state
     def _busy(self, is_busy: bool, hint: str) -> None:
@@ -317,10 +435,26 @@ class MainWindow(Gtk.ApplicationWindow):
             )
 
     def _set_labels_for_status(self, st: RepoStatus) -> None:
+        # Skip all GTK mutations (markup, style classes, label layout) when
+        # nothing the labels depend on changed since the last refresh.
+        status_key = (
+            st.ok,
+            st.error,
+            st.fetch_error,
+            st.repo_path,
+            st.branch,
+            st.upstream,
+            st.behind,
+            st.ahead,
+            st.dirty,
+            bool(SETTINGS.get("show_details_button", True)),
+        )
+        if status_key == getattr(self, "_last_status_key", None):
+            return
+        self._last_status_key = status_key
+
         if not st.ok:
-            self.primary_label.set_markup(
-                "<span size='xx-large' weight='bold' foreground='red'>Repository error</span>"
-            )
+            self.primary_label.set_markup(self._MKUP_ERROR)
             if self.details_label:
                 self.details_label.set_text(st.error or "Unknown error")
             return
@@ -335,45 +469,45 @@ class MainWindow(Gtk.ApplicationWindow):
             self.error_label.set_text(f"Fetch warning: {st.fetch_error}")
             self.error_revealer.set_reveal_child(True)
 
+        # Style-context mutations invalidate the style cascade; only touch
+        # the classes on an actual state transition.
         ctx = self.primary_label.get_style_context()
-        for c in ("status-up", "status-ok", "status-err"):
-            ctx.remove_class(c)
+        new_class = "status-up" if st.behind > 0 else None
+        current = getattr(self, "_current_status_class", None)
+        if new_class != current:
+            if current:
+                ctx.remove_class(current)
+            if new_class:
+                ctx.add_class(new_class)
+            self._current_status_class = new_class
 
         if st.behind > 0:
-            ctx.add_class("status-up")
-            self.primary_label.set_markup(
-                f"<span size='xx-large' weight='bold'>Updates available</span>\n"
-                f"<span size='large'>{st.behind} new commit(s) to pull</span>"
-            )
+            self.primary_label.set_markup(self._MKUP_UPDATES.format(behind=st.behind))
             if bool(SETTINGS.get("show_details_button", True)):
                 self.small_info_btn.set_label("Details…")
                 self.small_info_btn.show()
             else:
                 self.small_info_btn.hide()
         else:
-            self.primary_label.set_markup(
-                "<span size='xx-large' weight='bold'>Up to date</span>"
-            )
+            self.primary_label.set_markup(self._MKUP_UP_TO_DATE)
             self.small_info_btn.hide()
 
         if self.details_label:
-            branch = st.branch or "(unknown)"
-            upstream = st.upstream or "(no upstream)"
             changes = (
                 f"{st.dirty} file(s) changed locally"
                 if st.dirty > 0
                 else "Working tree clean"
             )
-            ahead = f"{st.ahead} ahead" if st.ahead > 0 else "not ahead"
-            behind = f"{st.behind} behind" if st.behind > 0 else "not behind"
-            details = [
-                f"Repo: {st.repo_path}",
-                f"Branch: {branch}",
-                f"Upstream: {upstream}",
-                f"Status: {changes}",
-                f"Sync: {ahead}, {behind}",
-            ]
-            self.details_label.set_text("\n".join(details))
+            self.details_label.set_text(
+                _DETAILS_FMT.format(
+                    repo=st.repo_path,
+                    branch=st.branch or "(unknown)",
+                    upstream=st.upstream or "(no upstream)",
+                    changes=changes,
+                    ahead=f"{st.ahead} ahead" if st.ahead > 0 else "not ahead",
+                    behind=f"{st.behind} behind" if st.behind > 0 else "not behind",
+                )
+            )
 
     # Error panel
     def _show_message(self, msg_type: Gtk.MessageType, message: str) -> None:
@@ -391,14 +525,31 @@ class MainWindow(Gtk.ApplicationWindow):
 
     # Update logs list
     def _add_log(self, event: str, summary: str, details: str) -> None:
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        self._update_logs.append(
-            (ts, event, summary + ("\n" + details if details else ""))
-        )
+        # strftime is slow enough to matter during burst logging; reuse the
+        # formatted string while the integer second is unchanged.
+        now = int(time.time())
+        if now != getattr(self, "_last_ts_sec", None):
+            self._last_ts_sec = now
+            # Plain f-string formatting skips libc's locale machinery
+            t = time.localtime(now)
+            self._last_ts_str = (
+                f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            )
+        ts = self._last_ts_str
+        self._log_ts.append(ts)
+        self._log_event.append(event)
+        body = summary + ("\n" + details if details else "")
+        self._log_details.append(body)
+        # Dialog bodies are built incrementally here so opening the logs
+        # dialog is a plain join, not an O(N) re-format of every entry.
+        self._log_brief.append(f"{ts} | {event}")
+        self._log_expanded.append(f"{ts}\nEvent: {event}\n{body}")
 
     # UI actions
     def on_refresh_clicked(self, _btn: Gtk.Button) -> None:
-        self.refresh_status()
+        # Explicit user action: bypass the fetch throttle
+        self.refresh_status(force_fetch=True)
 
     def on_logs_clicked(self, _btn: Gtk.Button) -> None:
         show_logs_dialog(self)
@@ -482,7 +633,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 except Exception as ex:
                     self.console.append(f"[keep-fish-config backup error] {ex}\n")
 
-        if not (os.path.isfile(setup_path) and os.access(setup_path, os.X_OK)):
+        if not _is_executable(setup_path):
             self._show_message(Gtk.MessageType.INFO, "No executable './setup' found.")
             return
 
@@ -497,17 +648,14 @@ class MainWindow(Gtk.ApplicationWindow):
                     use_pty=bool(SETTINGS.get("use_pty", True)),
                 )
                 self.console.set_process(p)
-                out = getattr(p, "stdout", None) if p else None
-                if p and out is not None:
-                    for line in iter(out.readline, ""):
-                        if not line:
-                            break
-                        self.console.append(str(line))
+                if p and getattr(p, "stdout", None) is not None:
+                    _drain_process_output(p, self.console.append)
                     rc = p.wait()
                     self.console.append(f"[installer exit {rc}]\n")
                     GLib.idle_add(
                         lambda: (
                             self._restore_fish_config_after_install(True),
+                            self._invalidate_refresh_cache(),
                             self.refresh_status(),
                             False,
                         )
@@ -520,6 +668,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 GLib.idle_add(
                     lambda: (
                         self._restore_fish_config_after_install(True),
+                        self._invalidate_refresh_cache(),
                         self.refresh_status(),
                         False,
                     )
@@ -527,26 +676,92 @@ class MainWindow(Gtk.ApplicationWindow):
             finally:
                 GLib.idle_add(self.refresh_status)
 
-        threading.Thread(target=work, daemon=True).start()
+        self._pool.submit(work)
 
     # Refresh logic
+    def _install_git_monitors(self) -> None:
+        """
+        Watch .git/HEAD, FETCH_HEAD and index via Gio file monitors so a
+        refresh runs when the repo actually changes instead of waiting for
+        the next timer tick. Best-effort: missing files or monitor failures
+        just leave the timer in charge.
+        """
+        if not REPO_PATH:
+            return
+        for name in ("HEAD", "FETCH_HEAD", "index"):
+            try:
+                gfile = Gio.File.new_for_path(
+                    os.path.join(REPO_PATH, ".git", name)
+                )
+                mon = gfile.monitor(Gio.FileMonitorFlags.NONE, None)
+                mon.connect("changed", self._on_git_file_changed)
+                # Keep a reference so the monitor is not garbage collected
+                self._git_monitors.append(mon)
+            except Exception:
+                continue
+
+    def _on_git_file_changed(self, *_args) -> None:
+        # Debounce: monitors can fire in bursts (e.g. index rewrite)
+        if time.time() - self._last_refresh_ts < 10:
+            return
+        self.refresh_status()
+
     def _auto_refresh(self) -> bool:
+        # Skip the tick when a monitor-triggered refresh ran recently
+        if time.time() - self._last_refresh_ts < 10:
+            return True
+        # The mtime gate only sees local state; once the fetch throttle
+        # expires a refresh must run anyway, or new upstream commits would
+        # never be discovered on an otherwise idle repo.
+        if should_fetch(REPO_PATH):
+            self.refresh_status()
+            return True
+        # Skip spawning the worker entirely when none of the git state
+        # files moved since the last successful poll (idle system).
+        if self._last_mtimes and _git_state_mtimes(REPO_PATH) == self._last_mtimes:
+            return True
         self.refresh_status()
         return True
 
-    def refresh_status(self) -> None:
+    def refresh_status(self, force_fetch: bool = False) -> None:
+        # Single-flight: overlapping calls coalesce into the run already in
+        # progress; one follow-up pass is scheduled when it finishes.
+        with self._refresh_lock:
+            if self._refresh_running:
+                self._refresh_pending = True
+                self._refresh_pending_force = self._refresh_pending_force or force_fetch
+                return
+            self._refresh_running = True
+        self._last_refresh_ts = time.time()
+
         def refresh_work():
-            st = check_repo_status(REPO_PATH)
-            GLib.idle_add(self._finish_refresh, st)
+            try:
+                st = check_repo_status(REPO_PATH, force_fetch=force_fetch)
+                GLib.idle_add(self._finish_refresh, st)
+            finally:
+                rerun = False
+                rerun_force = False
+                with self._refresh_lock:
+                    self._refresh_running = False
+                    if self._refresh_pending:
+                        self._refresh_pending = False
+                        rerun = True
+                        rerun_force = self._refresh_pending_force
+                        self._refresh_pending_force = False
+                if rerun:
+                    GLib.idle_add(
+                        lambda: (self.refresh_status(force_fetch=rerun_force), False)[1]
+                    )
 
         if self._status is None:
             self._busy(True, "Checking for updates...")
         else:
             self._busy(True, "Refreshing...")
-        threading.Thread(target=refresh_work, daemon=True).start()
+        self._pool.submit(refresh_work)
 
     def _finish_refresh(self, st: RepoStatus) -> None:
         self._status = st
+        self._last_mtimes = _git_state_mtimes(REPO_PATH)
         self._set_labels_for_status(st)
         self._apply_update_button_style()
         if hasattr(self, "view_btn"):
@@ -608,10 +823,17 @@ class MainWindow(Gtk.ApplicationWindow):
                 except Exception as ex:
                     self.console.append(f"[keep-fish-config backup error] {ex}\n")
 
+        # Read the installer mode once per click and thread it through;
+        # the worker below must not re-read SETTINGS mid-update.
         mode = str(SETTINGS.get("installer_mode", "auto"))
         if mode == "auto":
+            self.console.append("Installer mode: auto (pending decision).\n")
             full = self._auto_mode_decide_full(repo_path)
             self._auto_mode_choice = "full" if full else "files-only"
+        elif mode == "full":
+            self.console.append("Installer mode: full install.\n")
+        else:
+            self.console.append("Installer mode: files-only.\n")
 
         if not self._check_and_handle_unmerged_conflicts(repo_path):
             self.console.append(
@@ -623,53 +845,58 @@ class MainWindow(Gtk.ApplicationWindow):
         self._busy(True, "Updating...")
 
         def update_work():
+            # Bind the hot callables once; every self.console.append below is
+            # otherwise two dict lookups per call from the worker thread.
+            append = self.console.append
+
             # Precompute upstream-changed files (legacy logic kept)
             try:
                 self._compute_upstream_changed_ii(repo_path)
             except Exception as ex:
-                self.console.append(f"[precompute error] {ex}\n")
-
-            # Stash local changes if dirty
-            stashed = False
-            if self._status and self._status.dirty > 0:
-                self.console.append("Stashing local changes...\n")
-                subprocess.run(
+                append(f"[precompute error] {ex}\n")
+
+            # --autostash already stashes dirty files before the rebase and
+            # restores them afterwards, so no explicit stash push/pop pair.
+            # Stream pull output to the console instead of buffering it all;
+            # only stderr is kept for the failure message. --no-stat skips
+            # the diffstat computation nobody reads here.
+            pull_err = ""
+            try:
+                pull_proc = subprocess.Popen(
                     [
-                        "git",
-                        "stash",
-                        "push",
-                        "--include-untracked",
-                        "-m",
-                        "illogical-updots-auto",
+                        "git", "-C", repo_path,
+                        "pull", "--rebase", "--autostash", "--no-stat",
                     ],
-                    cwd=repo_path,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=GIT_ENV,
+                    close_fds=False,
                 )
-                stashed = True
+                # Collect stderr on the side so neither pipe can fill up and
+                # stall the pull while stdout is being drained.
+                err_parts: list = []
 
-            pull = subprocess.run(
-                ["git", "pull", "--rebase", "--autostash", "--stat"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-            success = pull.returncode == 0
-
-            if success and stashed:
-                self.console.append("Restoring stash...\n")
-                subprocess.run(
-                    ["git", "stash", "pop"],
-                    cwd=repo_path,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                )
+                def _collect_err(stream=pull_proc.stderr):
+                    try:
+                        err_parts.append(stream.read() or b"")
+                    except Exception:
+                        pass
+
+                t_err = threading.Thread(target=_collect_err, daemon=True)
+                t_err.start()
+                _drain_process_output(pull_proc, append)
+                success = pull_proc.wait() == 0
+                t_err.join(timeout=5)
+                pull_err = b"".join(err_parts).decode("utf-8", "replace")
+            except Exception as ex:
+                success = False
+                pull_err = str(ex)
+
+            # Settings reads hoisted: one lookup per update cycle
+            use_pty = bool(SETTINGS.get("use_pty", True))
 
-            # Decide install plan
-            plan_cmds = self._plan_install_commands()
-            mode_local = str(SETTINGS.get("installer_mode", "auto"))
+            # Decide install plan (mode captured at click time)
+            mode_local = mode
             full = False
             if mode_local == "auto":
                 full = getattr(self, "_auto_mode_choice", "files-only") == "full"
@@ -678,7 +905,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 full = True
             if mode_local in ("auto", "full"):
                 if full:
-                    if shutil.which("kitty") is not None:
+                    if self._kitty_path:
 
                         def _prep_tray():
                             self._ensure_tray_icon()
@@ -702,7 +929,7 @@ class MainWindow(Gtk.ApplicationWindow):
                             try:
                                 rc = subprocess.Popen(
                                     [
-                                        "kitty",
+                                        self._kitty_path,
                                         "-e",
                                         "fish",
                                         "-lc",
@@ -730,84 +957,96 @@ class MainWindow(Gtk.ApplicationWindow):
                                             == "x11"
                                             else None
                                         ),
+                                        self._invalidate_refresh_cache(),
                                         self.refresh_status(),
                                         False,
                                     )
                                 )
 
-                        threading.Thread(target=_kitty_work, daemon=True).start()
+                        self._pool.submit(_kitty_work)
                         return
                     else:
                         plan_cmds = [["./setup", "install"]]
                 else:
                     plan_cmds = [["./setup", "install-files"]]
+            else:
+                plan_cmds = self._plan_install_commands(mode_local)
 
             # Embedded installer path
             setup_path = os.path.join(repo_path, "setup")
-            if os.path.isfile(setup_path) and os.access(setup_path, os.X_OK):
-                self.console.append("Running installer...\n")
+            if _is_executable(setup_path):
+                append("Running installer...\n")
                 if not plan_cmds:
                     plan_cmds = [["./setup", "install-files"]]
                 extra_args = plan_cmds[0][1:]
                 try:
                     p = _spawn_setup_install(
                         repo_path,
-                        lambda m: self.console.append(str(m)),
+                        lambda m: append(str(m)),
                         extra_args=extra_args,
                         capture_stdout=True,
                         auto_input_seq=[],
-                        use_pty=bool(SETTINGS.get("use_pty", True)),
+                        use_pty=use_pty,
                     )
                     self.console.set_process(p)
-                    out = getattr(p, "stdout", None) if p else None
-                    if p and out is not None:
-                        for line in iter(out.readline, ""):
-                            if not line:
-                                break
-                            self.console.append(str(line))
+                    if p and getattr(p, "stdout", None) is not None:
+                        _drain_process_output(p, append)
                         rc = p.wait()
-                        self.console.append(f"[installer exit {rc}]\n")
+                        append(f"[installer exit {rc}]\n")
                         self.console.set_process(None)
                         if rc != 0 and "install-files" in extra_args:
-                            self.console.append(
-                                "[fallback] Retrying with 'install'...\n"
-                            )
+                            append("[fallback] Retrying with 'install'...\n")
                             p2 = _spawn_setup_install(
                                 repo_path,
-                                lambda m: self.console.append(str(m)),
+                                lambda m: append(str(m)),
                                 extra_args=["install"],
                                 capture_stdout=True,
                                 auto_input_seq=[],
-                                use_pty=bool(SETTINGS.get("use_pty", True)),
+                                use_pty=use_pty,
                             )
                             self.console.set_process(p2)
-                            out2 = getattr(p2, "stdout", None) if p2 else None
-                            if p2 and out2 is not None:
-                                for line in iter(out2.readline, ""):
-                                    if not line:
-                                        break
-                                    self.console.append(str(line))
+                            if p2 and getattr(p2, "stdout", None) is not None:
+                                _drain_process_output(p2, append)
                                 rc2 = p2.wait()
-                                self.console.append(f"[installer exit {rc2}]\n")
+                                append(f"[installer exit {rc2}]\n")
                             self.console.set_process(None)
                     else:
-                        self.console.append(
-                            "[warn] Installer spawn returned no stdout.\n"
-                        )
+                        append("[warn] Installer spawn returned no stdout.\n")
                 except Exception as ex:
-                    self.console.append(f"[installer error] {ex}\n")
+                    append(f"[installer error] {ex}\n")
             else:
-                self.console.append(
-                    "No executable './setup' found. Skipping installer.\n"
-                )
+                append("No executable './setup' found. Skipping installer.\n")
 
             GLib.idle_add(
-                lambda: self._finish_update(success, pull.stdout, pull.stderr)
+                lambda: self._finish_update(success, "", pull_err)
             )
 
-        threading.Thread(target=update_work, daemon=True).start()
+        self._pool.submit(update_work)
 
     # Keep fish config helpers
+    @staticmethod
+    def _iter_backup_files(root: str):
+        """
+        Yield regular file paths under root using os.scandir, which reuses
+        the type information from getdents instead of re-stat()ing every
+        entry like os.walk does. Symlinked directories are not followed.
+        """
+        stack = [root]
+        while stack:
+            d = stack.pop()
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
     def _backup_fish_config_before_install(self) -> None:
         """
         Create a zip backup of ~/.config/fish for later restore.
@@ -825,12 +1064,11 @@ class MainWindow(Gtk.ApplicationWindow):
         tmpdir = tempfile.gettempdir()
         zip_path = os.path.join(tmpdir, f"illogical-updots-fish-config-{ts}.zip")
         try:
-            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                for root, dirs, files in os.walk(target):
-                    for fn in files:
-                        full = os.path.join(root, fn)
-                        rel = os.path.relpath(full, target)
-                        zf.write(full, rel)
+            # Short-lived backup: skip deflate, the files are tiny text
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as zf:
+                for full in self._iter_backup_files(target):
+                    rel = os.path.relpath(full, target)
+                    zf.write(full, rel)
             self._fish_config_backup_zip = zip_path
             self.console.append(
                 f"[keep-fish-config] Backed up fish config to {zip_path}\n"
@@ -857,6 +1095,7 @@ class MainWindow(Gtk.ApplicationWindow):
         target = os.path.expanduser("~/.config/fish")
         import shutil
         import zipfile
+        import zlib
 
         def _prompt_and_restore():
             dlg = Gtk.MessageDialog(
@@ -882,15 +1121,60 @@ class MainWindow(Gtk.ApplicationWindow):
                         try:
                             if os.path.isdir(bak):
                                 shutil.rmtree(bak)
-                            shutil.copytree(target, bak)
+                            # copyfile skips the copystat metadata pass and
+                            # uses the kernel copy fast path on Linux
+                            shutil.copytree(
+                                target, bak, copy_function=shutil.copyfile
+                            )
                         except Exception:
                             pass
                     os.makedirs(target, exist_ok=True)
+
+                    # Most files are untouched by the install: the central
+                    # directory already carries each member's CRC32, so a
+                    # size + CRC match on the target proves identity without
+                    # decompressing anything.
+                    def _needs_write(zi):
+                        dest = os.path.join(target, zi.filename)
+                        try:
+                            # One open serves both probes: fstat for the
+                            # size, then the CRC from the same descriptor.
+                            # Fixed-size reads keep memory bounded even if a
+                            # large file sneaks into the config tree.
+                            with open(dest, "rb") as cur:
+                                if os.fstat(cur.fileno()).st_size == zi.file_size:
+                                    crc = 0
+                                    while True:
+                                        block = cur.read(65536)
+                                        if not block:
+                                            break
+                                        crc = zlib.crc32(block, crc)
+                                    if crc == zi.CRC:
+                                        return None
+                        except OSError:
+                            pass
+                        return zi
+
                     with zipfile.ZipFile(zip_path, "r") as zf:
-                        for member in zf.namelist():
-                            dest = os.path.join(target, member)
+                        members = [
+                            zi
+                            for zi in zf.infolist()
+                            if not zi.filename.endswith("/")
+                        ]
+                        # Classification is read-only and I/O bound, so it
+                        # parallelizes well; the writes stay sequential.
+                        with ThreadPoolExecutor(
+                            max_workers=min(8, os.cpu_count() or 2)
+                        ) as ex:
+                            to_write = [
+                                zi
+                                for zi in ex.map(_needs_write, members)
+                                if zi is not None
+                            ]
+                        for zi in to_write:
+                            dest = os.path.join(target, zi.filename)
                             os.makedirs(os.path.dirname(dest), exist_ok=True)
-                            with zf.open(member) as src, open(dest, "wb") as dst:
+                            with zf.open(zi) as src, open(dest, "wb") as dst:
                                 dst.write(src.read())
                     self.console.append(
                         f"[keep-fish-config] Restored config from {zip_path}\n"
@@ -905,8 +1189,47 @@ class MainWindow(Gtk.ApplicationWindow):
 
         GLib.idle_add(_prompt_and_restore)
 
+    def _notify(self, title: str, body: str, notif_id: str) -> None:
+        """
+        Send a desktop notification, debounced: rapid-fire calls within
+        300ms collapse into one D-Bus round-trip showing the latest text
+        (e.g. update completion immediately followed by the post-script).
+        """
+        if not bool(SETTINGS.get("send_notifications", True)):
+            return
+        self._pending_notif = (title, body, notif_id)
+        if getattr(self, "_notif_timer_armed", False):
+            return
+        self._notif_timer_armed = True
+        GLib.timeout_add(300, self._flush_notification)
+
+    def _flush_notification(self) -> bool:
+        self._notif_timer_armed = False
+        pending = getattr(self, "_pending_notif", None)
+        self._pending_notif = None
+        if not pending:
+            return False
+        title, body, notif_id = pending
+        try:
+            app = self.get_application()
+            if isinstance(app, Gio.Application):
+                notif = Gio.Notification.new(title)
+                notif.set_body(body)
+                app.send_notification(notif_id, notif)
+        except Exception:
+            pass
+        return False
+
+    def _invalidate_refresh_cache(self) -> None:
+        """
+        Drop the git-state mtime snapshot so the next refresh always runs.
+        Called after operations that change the repo outside the poll loop.
+        """
+        self._last_mtimes = ()
+
     def _finish_update(self, success: bool, stdout: str, stderr: str) -> None:
         self._busy(False, "")
+        self._invalidate_refresh_cache()
         title = "Update complete" if success else "Update failed"
         details = stdout + ("\n" + stderr if stderr else "")
         self._add_log(title, title, details)
@@ -916,15 +1239,11 @@ class MainWindow(Gtk.ApplicationWindow):
         except Exception:
             pass
         self.refresh_status()
-        if bool(SETTINGS.get("send_notifications", True)):
-            try:
-                app = self.get_application()
-                if isinstance(app, Gio.Application):
-                    notif = Gio.Notification.new(title)
-                    notif.set_body("Update succeeded." if success else "Update failed.")
-                    app.send_notification("illogical-updots-update", notif)
-            except Exception:
-                pass
+        self._notify(
+            title,
+            "Update succeeded." if success else "Update failed.",
+            "illogical-updots-update",
+        )
         # Offer tweaks restore & merge (beta)
         try:
             self._restore_fish_config_after_install(True)
@@ -941,7 +1260,6 @@ class MainWindow(Gtk.ApplicationWindow):
         (HEAD..upstream) and cache their relative paths for post-install decisions.
         """
         try:
-            self._upstream_changed_ii = set()
             st = getattr(self, "_status", None)
             branch = st.branch if st and st.branch else get_branch(repo_path)
             upstream = (
@@ -951,7 +1269,20 @@ class MainWindow(Gtk.ApplicationWindow):
                 run_git(["fetch", "--all", "--prune"], repo_path)
                 upstream = get_upstream(repo_path, branch)
             if not upstream:
+                self._upstream_changed_ii = set()
+                return
+            # Reuse the previous diff while both endpoints are unchanged:
+            # the delta is fully determined by the two SHAs (same keying
+            # as the commits-dialog cache in dialogs.changes).
+            key = None
+            rc, out, _ = run_git(["rev-parse", "HEAD", upstream], repo_path)
+            if rc == 0:
+                shas = out.split()
+                if len(shas) == 2:
+                    key = (shas[0], shas[1])
+            if key is not None and key == getattr(self, "_upstream_changed_key", None):
                 return
+            self._upstream_changed_ii = set()
             rc, out, _ = run_git(
                 [
                     "diff",
@@ -974,6 +1305,7 @@ class MainWindow(Gtk.ApplicationWindow):
                         if rel:
                             changed.append(rel)
             self._upstream_changed_ii = set(changed)
+            self._upstream_changed_key = key
             if changed:
                 self.console.append(
                     f"[info] Upstream-changed ii files: {len(changed)}\n"
@@ -982,16 +1314,25 @@ class MainWindow(Gtk.ApplicationWindow):
             # Best-effort; if it fails we just fall back to merge logic
             pass
 
-    def _plan_install_commands(self) -> list[list[str]]:
-        mode = str(SETTINGS.get("installer_mode", "auto"))
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _plan_for_mode(mode: str) -> tuple[tuple[str, ...], ...]:
+        """
+        Immutable command plan for an installer mode; cached per mode.
+        """
         if mode == "full":
-            self.console.append("Installer mode: full install.\n")
-            return [["./setup", "install"]]
-        if mode == "auto":
-            self.console.append("Installer mode: auto (pending decision).\n")
-            return [["./setup", "install-files"]]
-        self.console.append("Installer mode: files-only.\n")
-        return [["./setup", "install-files"]]
+            return (("./setup", "install"),)
+        # auto starts from files-only; the auto-mode dialog upgrades it
+        return (("./setup", "install-files"),)
+
+    @staticmethod
+    def _plan_install_commands(mode: str) -> list[list[str]]:
+        """
+        Map an installer mode to its setup command plan. Pure: the caller
+        logs the chosen mode once instead of this re-reading SETTINGS.
+        Returns fresh lists so callers may rebind/extend safely.
+        """
+        return [list(cmd) for cmd in MainWindow._plan_for_mode(mode)]
 
     def _ensure_tray_icon(self) -> None:
         if getattr(self, "_tray_icon", None):
@@ -1019,6 +1360,18 @@ class MainWindow(Gtk.ApplicationWindow):
             pass
 
     def _auto_mode_decide_full(self, repo_path: str) -> bool:
+        # Kick the network-bound fetch first so it overlaps the local
+        # branch/upstream resolution; wait for it only before diffing.
+        fetch_proc = None
+        try:
+            fetch_proc = subprocess.Popen(
+                ["git", "-C", repo_path, "fetch", "--all", "--prune"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except Exception:
+            fetch_proc = None
         upstream = None
         try:
             st = getattr(self, "_status", None)
@@ -1028,25 +1381,34 @@ class MainWindow(Gtk.ApplicationWindow):
             )
         except Exception:
             upstream = None
-        try:
-            run_git(["fetch", "--all", "--prune"], repo_path)
-        except Exception:
-            pass
+        if fetch_proc is not None:
+            try:
+                fetch_proc.wait(timeout=60)
+            except Exception:
+                try:
+                    fetch_proc.kill()
+                except Exception:
+                    pass
         changed = False
         if upstream:
-            for rel in ["sdata", "dist-arch"]:
-                rc, out, _ = run_git(
-                    ["diff", "--name-only", f"HEAD..{upstream}", "--", rel], repo_path
-                )
-                if rc == 0 and any(line.strip() for line in out.splitlines()):
-                    changed = True
-                    break
-        if not changed and not upstream:
-            for rel in ["sdata", "dist-arch"]:
-                rc, out, _ = run_git(["status", "--porcelain", "--", rel], repo_path)
-                if rc == 0 and any(line.strip() for line in out.splitlines()):
-                    changed = True
-                    break
+            # git takes multiple pathspecs, so one diff covers both dirs
+            rc, out, _ = run_git(
+                [
+                    "diff",
+                    "--name-only",
+                    f"HEAD..{upstream}",
+                    "--",
+                    "sdata",
+                    "dist-arch",
+                ],
+                repo_path,
+            )
+            changed = rc == 0 and any(line.strip() for line in out.splitlines())
+        else:
+            rc, out, _ = run_git(
+                ["status", "--porcelain", "--", "sdata", "dist-arch"], repo_path
+            )
+            changed = rc == 0 and any(line.strip() for line in out.splitlines())
         if not changed:
             return False
 
@@ -1067,34 +1429,22 @@ class MainWindow(Gtk.ApplicationWindow):
         return resp == Gtk.ResponseType.YES
 
     def _check_and_handle_unmerged_conflicts(self, repo_path: str) -> bool:
-        rc_u, out_u, _ = run_git(["diff", "--name-only", "--diff-filter=U"], repo_path)
-        unmerged_files = [
-            ln for ln in (out_u.splitlines() if rc_u == 0 else []) if ln.strip()
-        ]
+        unmerged_files = get_unmerged_files(repo_path)
 
-        merge_in_progress = (
-            subprocess.run(
-                ["git", "rev-parse", "-q", "--verify", "MERGE_HEAD"],
-                cwd=repo_path,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ).returncode
-            == 0
-        )
-        cherry_in_progress = (
-            subprocess.run(
-                ["git", "rev-parse", "-q", "--verify", "CHERRY_PICK_HEAD"],
-                cwd=repo_path,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ).returncode
-            == 0
-        )
-        rebase_in_progress = any(
-            os.path.isdir(os.path.join(repo_path, ".git", d))
-            for d in ("rebase-apply", "rebase-merge")
+        # MERGE_HEAD/CHERRY_PICK_HEAD/rebase-* are sentinel entries in the
+        # git dir; one scandir pass replaces per-sentinel stats (and the
+        # two git rev-parse spawns this check used to make).
+        git_dir = _resolve_git_dir(repo_path)
+        entries: set[str] = set()
+        try:
+            with os.scandir(git_dir) as it:
+                entries = {e.name for e in it}
+        except OSError:
+            pass
+        merge_in_progress = "MERGE_HEAD" in entries
+        cherry_in_progress = "CHERRY_PICK_HEAD" in entries
+        rebase_in_progress = (
+            "rebase-apply" in entries or "rebase-merge" in entries
         )
 
         if not (
@@ -1105,17 +1455,18 @@ class MainWindow(Gtk.ApplicationWindow):
         ):
             return True
 
-        # Build dialog message
-        msg = "Unresolved merge/rebase detected.\n\n"
+        # Build dialog message (join once instead of string re-concatenation)
+        parts = ["Unresolved merge/rebase detected.\n\n"]
         if unmerged_files:
-            msg += f"Unmerged files: {len(unmerged_files)}\n"
+            parts.append(f"Unmerged files: {len(unmerged_files)}\n")
         if merge_in_progress:
-            msg += "A merge is in progress.\n"
+            parts.append("A merge is in progress.\n")
         if rebase_in_progress:
-            msg += "A rebase is in progress.\n"
+            parts.append("A rebase is in progress.\n")
         if cherry_in_progress:
-            msg += "A cherry-pick is in progress.\n"
-        msg += "\nAbort the in-progress operation(s) and continue?"
+            parts.append("A cherry-pick is in progress.\n")
+        parts.append("\nAbort the in-progress operation(s) and continue?")
+        msg = "".join(parts)
 
         dialog = Gtk.MessageDialog(
             transient_for=self,
@@ -1133,46 +1484,23 @@ class MainWindow(Gtk.ApplicationWindow):
             return False
 
         ok = True
-        if merge_in_progress:
-            self.console.append("[git] merge --abort\n")
-            r = subprocess.run(
-                ["git", "merge", "--abort"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-            if r.returncode != 0:
-                ok = False
-                self.console.append(f"[git error] merge --abort: {r.stderr}\n")
-        if rebase_in_progress:
-            self.console.append("[git] rebase --abort\n")
-            r = subprocess.run(
-                ["git", "rebase", "--abort"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-            if r.returncode != 0:
-                ok = False
-                self.console.append(f"[git error] rebase --abort: {r.stderr}\n")
-        if cherry_in_progress:
-            self.console.append("[git] cherry-pick --abort\n")
-            r = subprocess.run(
-                ["git", "cherry-pick", "--abort"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-            if r.returncode != 0:
+        # run_git keeps these short-lived helpers on the posix_spawn fast
+        # path (git -C, no cwd fork) instead of raw subprocess.run.
+        aborts = [
+            (merge_in_progress, "merge"),
+            (rebase_in_progress, "rebase"),
+            (cherry_in_progress, "cherry-pick"),
+        ]
+        for in_progress, op in aborts:
+            if not in_progress:
+                continue
+            self.console.append(f"[git] {op} --abort\n")
+            rc, _out, err = run_git([op, "--abort"], repo_path)
+            if rc != 0:
                 ok = False
-                self.console.append(f"[git error] cherry-pick --abort: {r.stderr}\n")
+                self.console.append(f"[git error] {op} --abort: {err}\n")
 
-        rc_u2, out_u2, _ = run_git(
-            ["diff", "--name-only", "--diff-filter=U"], repo_path
-        )
-        still_unmerged = [
-            ln for ln in (out_u2.splitlines() if rc_u2 == 0 else []) if ln.strip()
-        ]
+        still_unmerged = get_unmerged_files(repo_path)
         if still_unmerged:
             ok = False
             self.console.append(
@@ -1211,46 +1539,43 @@ class MainWindow(Gtk.ApplicationWindow):
                         "[post-script] script not executable; running via fish interpreter\n"
                     )
                 self.console.append(f"$ fish -lc {shlex.quote(cmd_str)}\n")
+                # PYTHONUNBUFFERED keeps Python post-scripts streaming
+                # instead of stalling in 8KB block-buffered chunks when
+                # their stdout is a pipe; harmless for shell scripts.
+                env = dict(os.environ)
+                env["PYTHONUNBUFFERED"] = "1"
+                # Binary block-buffered pipe; the shared drain helper does
+                # chunked reads + incremental decode like the installer path.
                 p = subprocess.Popen(
                     ["fish", "-lc", cmd_str],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    bufsize=1,
+                    bufsize=-1,
+                    env=env,
                 )
-                assert p.stdout is not None
-                for line in iter(p.stdout.readline, ""):
-                    if not line:
-                        break
-                    self.console.append(str(line))
+                if p.stdout is not None:
+                    _drain_process_output(p, self.console.append)
                 rc = p.wait()
                 self.console.append(f"[post-script exit {rc}]\n")
-                if bool(SETTINGS.get("send_notifications", True)):
-                    try:
-                        app = self.get_application()
-                        if isinstance(app, Gio.Application):
-                            n = Gio.Notification.new("Post script finished")
-                            n.set_body(
-                                "Exit code 0 (success)"
-                                if rc == 0
-                                else f"Exit code {rc} (errors)"
-                            )
-                            app.send_notification("illogical-updots-post-script", n)
-                    except Exception:
-                        pass
+                GLib.idle_add(
+                    self._notify,
+                    "Post script finished",
+                    "Exit code 0 (success)" if rc == 0 else f"Exit code {rc} (errors)",
+                    "illogical-updots-post-script",
+                )
             except Exception as ex:
                 self.console.append(f"[post-script error] {ex}\n")
 
-        threading.Thread(target=work, daemon=True).start()
+        self._pool.submit(work)
 
     # External installer run (explicit)
     def run_install_external(self) -> None:
         setup_path = os.path.join(REPO_PATH, "setup")
-        if not (os.path.isfile(setup_path) and os.access(setup_path, os.X_OK)):
+        if not _is_executable(setup_path):
             self._show_message(Gtk.MessageType.INFO, "No executable './setup' found.")
             return
+        from widgets.console import SetupConsole
+
         console = SetupConsole(self, title="Installer (setup install)")
         console.present()
         console.run_process(
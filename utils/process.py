@@ -11,12 +11,13 @@ This module centralizes:
 
 from __future__ import annotations
 
+import codecs
 import errno
-import io
 import os
 import shlex
 import subprocess
 import threading
+from functools import lru_cache
 from typing import (
     Callable,
     Dict,
@@ -28,10 +29,21 @@ from typing import (
     Sequence,
 )
 
+try:
+    from core.app_meta import SETTINGS  # type: ignore
+except Exception:  # pragma: no cover - defensive
+    SETTINGS = {}  # type: ignore[assignment]
+
 
 # -------------------------------------------------------------------
 # Environment helpers
 # -------------------------------------------------------------------
+# Template for the common build_color_env() call (no base, color forced),
+# rebuilt only when os.environ itself changes.
+_COLOR_ENV_TEMPLATE: Optional[Dict[str, str]] = None
+_COLOR_ENV_BASE_LEN: int = -1
+
+
 def build_color_env(
     base: Optional[Mapping[str, str]] = None, force_color: bool = True
 ) -> Dict[str, str]:
@@ -44,7 +56,19 @@ def build_color_env(
 
     Returns:
         A new environment dictionary safe to pass to subprocess calls.
+
+    The default call (no base, color forced) is served from a cached
+    template so repeated spawns copy one dict instead of re-deriving it.
     """
+    global _COLOR_ENV_TEMPLATE, _COLOR_ENV_BASE_LEN
+    if base is None and force_color:
+        if (
+            _COLOR_ENV_TEMPLATE is None
+            or _COLOR_ENV_BASE_LEN != len(os.environ)
+        ):
+            _COLOR_ENV_BASE_LEN = len(os.environ)
+            _COLOR_ENV_TEMPLATE = build_color_env(dict(os.environ), True)
+        return dict(_COLOR_ENV_TEMPLATE)
     env: Dict[str, str] = dict(base or os.environ)
     if force_color:
         env.update(
@@ -119,6 +143,109 @@ def stream_process_lines(
     return rc
 
 
+# -------------------------------------------------------------------
+# Chunked output drain
+# -------------------------------------------------------------------
+def drain_process_output(
+    p,
+    on_text: Callable[[str], None],
+    chunk_size: int = 65536,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> None:
+    """
+    Drain a process's output to a callback in large chunks.
+
+    Reads the raw file descriptor (PTY master when present, else the
+    stdout pipe) with os.read in chunk_size blocks and decodes through an
+    incremental utf-8 decoder so multi-byte sequences split across chunks
+    survive. This replaces readline loops that wake per line; the callback
+    receives arbitrary-size text chunks instead of single lines.
+
+    When should_stop is given, the fd is polled with a short selector
+    timeout and the loop exits early once the callable returns True (e.g.
+    the owning window was destroyed), instead of blocking in os.read until
+    the child finally closes its end.
+
+    Falls back to the .stdout readline interface when no usable fd exists.
+    Returns once the stream hits EOF (or EIO for a closed PTY).
+    """
+    fd = getattr(p, "_pty_master_fd", None)
+    if fd is None:
+        out = getattr(p, "stdout", None)
+        try:
+            fd = out.fileno() if out is not None else None
+        except Exception:
+            fd = None
+
+    if fd is None:
+        out = getattr(p, "stdout", None)
+        if out is None:
+            return
+        try:
+            for line in iter(out.readline, ""):
+                if not line:
+                    break
+                if should_stop is not None and should_stop():
+                    return
+                on_text(str(line))
+        except Exception as ex:
+            on_text(f"[stream error] {ex}\n")
+        return
+
+    sel = None
+    if should_stop is not None:
+        import selectors
+
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(fd, selectors.EVENT_READ)
+        except Exception:
+            sel = None
+        if sel is not None:
+            # Non-blocking fd: os.read can then never park the thread
+            # between selector wakeups (spurious readability, PTY quirks);
+            # EAGAIN simply loops back into select.
+            try:
+                import fcntl
+
+                flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            except Exception:
+                pass
+
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    try:
+        while True:
+            if sel is not None:
+                if should_stop():
+                    return
+                if not sel.select(0.25):
+                    continue
+            try:
+                chunk = os.read(fd, chunk_size)
+            except OSError as ex:
+                if ex.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    continue
+                # Linux PTYs raise EIO at EOF instead of returning b"".
+                if ex.errno != errno.EIO:
+                    on_text(f"[stream error] {ex}\n")
+                chunk = b""
+            if not chunk:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    on_text(tail)
+                return
+            text = decoder.decode(chunk)
+            if text:
+                on_text(text)
+    finally:
+        if sel is not None:
+            try:
+                sel.close()
+            except Exception:
+                pass
+
+
 # -------------------------------------------------------------------
 # Setup installer spawning (PTY-aware)
 # -------------------------------------------------------------------
@@ -161,17 +288,36 @@ def spawn_setup_install(
         The returned process may carry a non-standard attribute:
             - _pty_master_fd (int): master end of the PTY for writing.
     """
-    import pty  # Imported locally to avoid hard dependency if not used
-
     extra_args = extra_args or []
     base_cmds: List[List[str]] = [
         ["./setup"] + extra_args,
         ["fish", "./setup"] + extra_args,
         ["sh", "./setup"] + extra_args,
     ]
-
-    def _env():
-        return build_color_env()
+    # Shebang sniff: a script with neither '#!' nor an ELF header can
+    # only fail the direct ./setup attempt with ENOEXEC, so skip that
+    # doomed execve and start at the interpreter fallbacks. Shebang
+    # scripts and native binaries exec fine, and on any read problem we
+    # keep the full chain rather than guess.
+    try:
+        with open(os.path.join(repo_path, "setup"), "rb") as fh:
+            magic = fh.read(4)
+        if not magic.startswith(b"#!") and magic != b"\x7fELF":
+            base_cmds = base_cmds[1:]
+    except OSError:
+        pass
+
+    # One env build shared by every fallback attempt
+    env = build_color_env()
+
+    # Per-write [auto-input] confirmations are debug chatter; keep them
+    # out of the console buffer unless explicitly enabled. Errors and
+    # warnings always log.
+    if bool(SETTINGS.get("verbose_spawn_log", False)):
+        log_verbose = logger
+    else:
+        def log_verbose(_msg: str) -> None:
+            return None
 
     for cmd in base_cmds:
         try:
@@ -179,6 +325,10 @@ def spawn_setup_install(
             _use_pty = use_pty
             if _use_pty:
                 try:
+                    # Deferred: pty drags in tty/termios, which non-PTY
+                    # spawns never need
+                    import pty
+
                     master_fd, slave_fd = pty.openpty()
                 except Exception as ex:
                     logger(f"[pty-warn] failed to open pty: {ex}; fallback no-pty\n")
@@ -193,7 +343,7 @@ def spawn_setup_install(
                     stdin=slave_fd,
                     stdout=slave_fd,
                     stderr=slave_fd,
-                    env=_env(),
+                    env=env,
                     close_fds=True,
                 )
                 # Close slave in parent
@@ -203,37 +353,45 @@ def spawn_setup_install(
                     pass
 
                 master_file = os.fdopen(master_fd, "rb", buffering=0)
-                text_stream = io.TextIOWrapper(
-                    master_file, encoding="utf-8", errors="replace", newline="\n"
-                )
 
                 class PTYStdout:
                     """
-                    Simple line-buffered reader for PTY streams.
-                    Collects until newline; returns lines preserving newline.
+                    Line-buffered reader for PTY streams using block reads:
+                    each raw read pulls up to 4KiB per syscall and complete
+                    lines are split off the decoded buffer (instead of one
+                    read+decode per character).
                     """
 
-                    def __init__(self, stream):
-                        self._stream = stream
+                    def __init__(self, raw):
+                        self._raw = raw
+                        self._decoder = codecs.getincrementaldecoder("utf-8")(
+                            "replace"
+                        )
                         self._buffer = ""
+                        self._eof = False
 
                     def readline(self):
                         while True:
-                            chunk = self._stream.read(1)
-                            if not chunk:
-                                if self._buffer:
-                                    out = self._buffer
-                                    self._buffer = ""
-                                    return out
-                                return ""
-                            self._buffer += chunk
                             if "\n" in self._buffer:
-                                line, rest = self._buffer.split("\n", 1)
-                                self._buffer = rest
+                                line, self._buffer = self._buffer.split("\n", 1)
                                 return line + "\n"
+                            if self._eof:
+                                out = self._buffer
+                                self._buffer = ""
+                                return out
+                            try:
+                                chunk = self._raw.read(4096)
+                            except OSError:
+                                # PTYs raise EIO when the child side closes
+                                chunk = b""
+                            if chunk:
+                                self._buffer += self._decoder.decode(chunk)
+                            else:
+                                self._eof = True
+                                self._buffer += self._decoder.decode(b"", True)
 
                 # Monkey-patch: emulate .stdout for stream consumers
-                p.stdout = PTYStdout(text_stream)  # type: ignore[attr-defined]
+                p.stdout = PTYStdout(master_file)  # type: ignore[attr-defined]
                 p._pty_master_fd = master_fd  # type: ignore[attr-defined]
                 logger(f"[spawn/pty] {' '.join(cmd)}\n")
             else:
@@ -246,7 +404,7 @@ def spawn_setup_install(
                     stdin=subprocess.PIPE,
                     universal_newlines=True,
                     bufsize=1,
-                    env=_env(),
+                    env=env,
                 )
                 logger(f"[spawn] {' '.join(cmd)}\n")
 
@@ -275,7 +433,7 @@ def spawn_setup_install(
                                     logger("[auto-input] stdin closed; stopping\n")
                                     break
                                 os.write(pipe.fileno(), item.encode("utf-8", "replace"))
-                            logger(f"[auto-input] {repr(item)}\n")
+                            log_verbose(f"[auto-input] {repr(item)}\n")
                         except Exception as _ex:
                             logger(f"[auto-input-error] {_ex}\n")
                             break
@@ -290,7 +448,7 @@ def spawn_setup_install(
                             os.write(
                                 pipe.fileno(), yesforall.encode("utf-8", "replace")
                             )
-                        logger(f"[auto-input] {repr(yesforall)}\n")
+                        log_verbose(f"[auto-input] {repr(yesforall)}\n")
                     except Exception as _ex:
                         logger(f"[auto-input-error] {_ex}\n")
 
@@ -309,7 +467,7 @@ def spawn_setup_install(
                             os.write(master_fd_local, msg.encode("utf-8", "replace"))
                         elif pipe:
                             os.write(pipe.fileno(), msg.encode("utf-8", "replace"))
-                        logger(f"[auto-input] {repr(msg)}\n")
+                        log_verbose(f"[auto-input] {repr(msg)}\n")
                     except Exception as _ex:
                         logger(f"[auto-input-error] {_ex}\n")
 
@@ -335,6 +493,24 @@ def spawn_setup_install(
 # -------------------------------------------------------------------
 # External terminal launcher
 # -------------------------------------------------------------------
+# First terminal emulator found on PATH, resolved once per process. Each
+# shutil.which walks every $PATH entry, so probing up to six emulators on
+# every install click adds dozens of stat calls for a stable answer.
+_TERMINAL_CACHE: Optional[List[str]] = None
+
+
+def _find_terminal(terminals) -> Optional[List[str]]:
+    global _TERMINAL_CACHE
+    if _TERMINAL_CACHE is None:
+        for name, base in terminals:
+            if shutil_which(name):
+                _TERMINAL_CACHE = base
+                break
+        else:
+            _TERMINAL_CACHE = []
+    return _TERMINAL_CACHE or None
+
+
 def launch_install_external(
     repo_path: str, extra_args: Optional[Iterable[str]] = None
 ) -> None:
@@ -359,38 +535,34 @@ def launch_install_external(
         ("konsole", ["konsole", "-e"]),
         ("foot", ["foot", "sh", "-c"]),
     ]
-    for name, base in terminals:
-        if shutil_which(name):
-            if base[-1] == "-c":
-                # Already expecting a shell command string
-                shell_cmd = f"cd {shlex.quote(repo_path)} && {shlex.quote(cmd[0])} {' '.join(map(shlex.quote, cmd[1:]))}"
-                full = base + [shell_cmd]
-            elif base and base[-1] in ("--", "-e"):
-                # Will pass the command vector directly
-                full = base + [
-                    "sh",
-                    "-c",
-                    f"cd {shlex.quote(repo_path)} && {shlex.join(cmd)}",
-                ]
-            else:
-                full = base + [
-                    "sh",
-                    "-c",
-                    f"cd {shlex.quote(repo_path)} && {shlex.join(cmd)}",
-                ]
-            try:
-                subprocess.Popen(full)
-                return
-            except Exception:
-                continue
+    base = _find_terminal(terminals)
+    if base:
+        if base[-1] == "-c":
+            # Already expecting a shell command string
+            shell_cmd = f"cd {shlex.quote(repo_path)} && {shlex.quote(cmd[0])} {' '.join(map(shlex.quote, cmd[1:]))}"
+            full = base + [shell_cmd]
+        else:
+            # Will pass the command vector directly
+            full = base + [
+                "sh",
+                "-c",
+                f"cd {shlex.quote(repo_path)} && {shlex.join(cmd)}",
+            ]
+        try:
+            subprocess.Popen(full)
+            return
+        except Exception:
+            pass
 
     # Fallback: run directly in background (no terminal)
     subprocess.Popen(cmd, cwd=repo_path)
 
 
+@lru_cache(maxsize=32)
 def shutil_which(prog: str) -> Optional[str]:
     """
     Small shim for shutil.which to avoid importing the whole module at top-level.
+    Results are cached; PATH rarely changes within a session.
     """
     try:
         import shutil
@@ -403,6 +575,7 @@ def shutil_which(prog: str) -> Optional[str]:
 __all__ = [
     "build_color_env",
     "stream_process_lines",
+    "drain_process_output",
     "spawn_setup_install",
     "launch_install_external",
 ]
@@ -1,35 +1,39 @@
 import urllib.request
+from functools import lru_cache
+
 import gi
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import Gtk, GdkPixbuf
 
+# Downloaded (and scaled) avatar pixbufs keyed by URL. Failed downloads are
+# cached as None so an unreachable avatar is probed at most once per run.
+_PIXBUF_CACHE: dict = {}
+
 
 def fetch_github_avatar_url(email: str) -> str:
     """
-    Naive attempt to guess GitHub avatar by using local-part as username.
-    Returns direct PNG URL if reachable, else empty string.
+    Guess the GitHub avatar URL for an email without any network probe.
+
+    The old HEAD request cost a TLS handshake per author just to predict
+    whether the later GET would succeed; the GET itself already fails
+    gracefully (fetch_avatar_pixbuf caches the miss), so the probe is
+    pure overhead and this is now a plain URL guess.
     """
-    try:
-        local = (email or "").split("@")[0]
-        if not local:
-            return ""
-        url = f"https://github.com/{local}.png"
-        req = urllib.request.Request(url, method="HEAD")
-        with urllib.request.urlopen(req, timeout=3) as resp:
-            if resp.status == 200:
-                return url
-    except Exception:
-        pass
-    return ""
+    return guess_github_avatar(email)
 
 
-def make_avatar_image(url: str) -> Gtk.Image:
+def fetch_avatar_pixbuf(url: str, size: int = 32):
+    """
+    Download and scale an avatar once per URL; later calls hit the cache.
+    Returns a GdkPixbuf.Pixbuf or None on failure.
+    """
     if not url:
-        return Gtk.Image.new_from_icon_name(
-            "avatar-default-symbolic", Gtk.IconSize.MENU
-        )
+        return None
+    if url in _PIXBUF_CACHE:
+        return _PIXBUF_CACHE[url]
+    pixbuf = None
     try:
         with urllib.request.urlopen(url, timeout=5) as resp:
             data = resp.read()
@@ -38,14 +42,25 @@ def make_avatar_image(url: str) -> Gtk.Image:
         loader.close()
         pixbuf = loader.get_pixbuf()
         if pixbuf:
-            # Scale to 32x32 preserving aspect
-            scaled = pixbuf.scale_simple(32, 32, GdkPixbuf.InterpType.BILINEAR)
-            return Gtk.Image.new_from_pixbuf(scaled or pixbuf)
+            # Scale to size x size preserving aspect
+            pixbuf = (
+                pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+                or pixbuf
+            )
     except Exception:
-        pass
+        pixbuf = None
+    _PIXBUF_CACHE[url] = pixbuf
+    return pixbuf
+
+
+def make_avatar_image(url: str) -> Gtk.Image:
+    pixbuf = fetch_avatar_pixbuf(url)
+    if pixbuf:
+        return Gtk.Image.new_from_pixbuf(pixbuf)
     return Gtk.Image.new_from_icon_name("avatar-default-symbolic", Gtk.IconSize.MENU)
 
 
+@lru_cache(maxsize=256)
 def guess_github_avatar(email: str) -> str:
     """
     Try to extract username for GitHub-hosted emails, else fallback to local-part guess
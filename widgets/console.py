@@ -1,4 +1,5 @@
 import os
+import re
 import shlex
 import subprocess
 import threading
@@ -11,6 +12,17 @@ gi.require_version("Gdk", "3.0")
 from gi.repository import Gtk, Gdk, GLib
 
 from helpers.ansi import insert_ansi_formatted
+from utils.process import drain_process_output
+
+try:
+    from style.css import install_app_css
+except Exception:
+    install_app_css = None
+
+try:
+    from core.app_meta import SETTINGS
+except Exception:
+    SETTINGS = {}
 
 
 class SetupConsole(Gtk.Window):
@@ -22,6 +34,13 @@ class SetupConsole(Gtk.Window):
 
     # PASSWORD_PATTERNS disabled (no auto password detection)
     PASSWORD_PATTERNS: list[str] = []
+    # Compiled once per class: one alternation regex instead of a per-line
+    # pattern loop; None while the pattern list is empty.
+    _PW_RE = (
+        re.compile("|".join(PASSWORD_PATTERNS), re.IGNORECASE)
+        if PASSWORD_PATTERNS
+        else None
+    )
 
     def __init__(self, parent: Gtk.Window, title: str = "Setup Console"):
         super().__init__(title=title, transient_for=parent)
@@ -45,6 +64,14 @@ class SetupConsole(Gtk.Window):
         self._apply_css()
 
         self.buf = self.textview.get_buffer()
+        # One right-gravity mark that rides the end of the buffer; every
+        # scroll reuses it instead of allocating a fresh anonymous mark.
+        self._end_mark = self.buf.create_mark(None, self.buf.get_end_iter(), False)
+        # Scrollback limit cached once; the window lives for one install
+        try:
+            self._log_max_lines = int(SETTINGS.get("log_max_lines", 0))
+        except Exception:
+            self._log_max_lines = 0
         sw = Gtk.ScrolledWindow()
         sw.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         sw.add(self.textview)
@@ -92,21 +119,19 @@ class SetupConsole(Gtk.Window):
         self._password_cached: Optional[str] = None
         self._finished_callback = None
 
+        # Stream batching: the reader thread queues chunks and a 50ms
+        # main-loop timeout drains them with a single buffer insert.
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Rolling newline count so trimming never asks the buffer to
+        # recount its lines on every flush.
+        self._line_count = 0
+
     def _apply_css(self):
-        css = """
-        .setup-console {
-            font-size: 12px;
-            line-height: 1.25;
-        }
-        """
         try:
-            provider = Gtk.CssProvider()
-            provider.load_from_data(css.encode("utf-8"))
-            screen = Gdk.Screen.get_default()
-            if screen:
-                Gtk.StyleContext.add_provider_for_screen(
-                    screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
+            if install_app_css:
+                install_app_css()
             self.textview.get_style_context().add_class("setup-console")
         except Exception:
             pass
@@ -121,19 +146,10 @@ class SetupConsole(Gtk.Window):
                 # If not realized yet, just buffer text without scrolling
                 self.buf.insert(self.buf.get_end_iter(), text)
                 return
-            # Safe insertion using offsets to avoid iterator reuse issues
-            start_offset = self.buf.get_char_count()
             self.buf.insert(self.buf.get_end_iter(), text)
-            end_offset = self.buf.get_char_count()
-            start_it = self.buf.get_iter_at_offset(start_offset)
-            end_it = self.buf.get_iter_at_offset(end_offset)
-            # Scroll only if still visible
+            # Scroll only if still visible, reusing the persistent end mark
             if tv.get_visible():
-                start_it = self.buf.get_iter_at_offset(start_offset)
-                end_it = self.buf.get_iter_at_offset(end_offset)
-                # Create mark at end and scroll
-                mark = self.buf.create_mark(None, end_it, False)
-                tv.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
+                tv.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
         except Exception:
             pass
 
@@ -163,16 +179,16 @@ class SetupConsole(Gtk.Window):
                     }
                 )
                 env.pop("NO_COLOR", None)
+                # Binary, fully-buffered pipes: the reader drains the raw fd
+                # in chunks and decodes itself, so the line-buffered
+                # TextIOWrapper would only add a per-line decode layer.
                 self._proc = subprocess.Popen(
                     argv,
                     cwd=cwd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     stdin=subprocess.PIPE,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    bufsize=1,
+                    bufsize=-1,
                     env=env,
                 )
         except Exception as ex:
@@ -188,36 +204,62 @@ class SetupConsole(Gtk.Window):
             return
         threading.Thread(target=self._stream_loop, daemon=True).start()
 
-    def _stream_loop(self):
-        assert self._proc and self._proc.stdout
-        for line in iter(self._proc.stdout.readline, ""):
-            if not line:
-                break
+    def _queue_text(self, text: str):
+        """
+        Queue a chunk from the reader thread and arm the 50ms flush.
+        """
+        self._maybe_password_prompt(text)
+        with self._pending_lock:
+            self._pending.append(text)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        GLib.timeout_add(50, self._flush_pending)
 
-            # Schedule UI mutation on main thread to avoid iterator invalidation
-            def _append_line(text_line=line):
-                try:
-                    insert_ansi_formatted(self.buf, text_line)
-                except Exception:
-                    self._append(text_line)
-                mark = self.buf.create_mark(None, self.buf.get_end_iter(), False)
-                self.textview.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
-                # Trim console lines if limit configured
-                try:
-                    # limit = int(SETTINGS.get("log_max_lines", 0))
-                    # if limit and self.buf.get_line_count() > limit:
-                    #     s_it = self.buf.get_start_iter()
-                    #     e_it = self.buf.get_iter_at_line(
-                    #         self.buf.get_line_count() - limit
-                    #     )
-                    #     self.buf.delete(s_it, e_it)
-                    pass
-                except Exception:
-                    pass
-                return False
+    def _flush_pending(self) -> bool:
+        """
+        Drain queued chunks with one insert + one scroll (main loop only).
+        """
+        with self._pending_lock:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        if not text or getattr(self, "_destroyed", False):
+            return False
+        try:
+            insert_ansi_formatted(self.buf, text)
+        except Exception:
+            self._append(text)
+            return False
+        self._line_count += text.count("\n")
+        # Scrollback cap: trim in one batched delete once the buffer runs
+        # a few hundred lines past the limit (hysteresis keeps deletes rare).
+        try:
+            limit = self._log_max_lines
+            if limit and self._line_count > limit + 256:
+                excess = self._line_count - limit
+                s_it = self.buf.get_start_iter()
+                e_it = self.buf.get_iter_at_line(excess)
+                self.buf.delete(s_it, e_it)
+                self._line_count = limit
+        except Exception:
+            pass
+        try:
+            self.textview.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
+        except Exception:
+            pass
+        return False
 
-            GLib.idle_add(_append_line)
-            self._maybe_password_prompt(line)
+    def _stream_loop(self):
+        assert self._proc
+        # Chunked fd reads (PTY master or stdout pipe); chunks land in the
+        # pending queue and hit the TextView in coalesced batches instead of
+        # one idle_add per output line.
+        drain_process_output(
+            self._proc,
+            self._queue_text,
+            should_stop=lambda: getattr(self, "_destroyed", False),
+        )
         rc = self._proc.wait()
 
         def _final():
@@ -314,8 +356,10 @@ class SetupConsole(Gtk.Window):
                 self._append(f"[ctrl-c error] {ex}\n")
 
     def _maybe_password_prompt(self, line: str):
-        # Disabled: do not auto-handle password prompts
-        return
+        # Auto-handling stays disabled while PASSWORD_PATTERNS is empty;
+        # with patterns present this is one precompiled regex search.
+        if self._PW_RE is None or not self._PW_RE.search(line):
+            return
 
     def _on_key_press(self, _widget, event) -> bool:
         # if event.state & Gdk.ModifierType.CONTROL_MASK and event.keyval in (
@@ -355,8 +399,8 @@ def _spawn_setup_install(
     Returns a Popen object or None. When PTY is used we monkey-patch p.stdout with a
     text wrapper so existing readline loops continue to work.
     """
+    import codecs
     import errno
-    import io
     import os
     import pty
 
@@ -366,19 +410,29 @@ def _spawn_setup_install(
         ["bash", "./setup"] + extra_args,
         ["sh", "./setup"] + extra_args,
     ]
-
-    def _env():
-        env = dict(os.environ)
-        env.update(
-            {
-                "FORCE_COLOR": "1",
-                "CLICOLOR": "1",
-                "CLICOLOR_FORCE": "1",
-                "TERM": "xterm-256color",
-            }
-        )
-        env.pop("NO_COLOR", None)
-        return env
+    # Shebang sniff: with neither '#!' nor an ELF header the direct
+    # ./setup attempt can only fail with ENOEXEC, so start at the
+    # interpreter fallbacks instead; binaries and shebang scripts keep
+    # the direct fast path
+    try:
+        with open(os.path.join(repo_path, "setup"), "rb") as fh:
+            magic = fh.read(4)
+        if not magic.startswith(b"#!") and magic != b"\x7fELF":
+            base_cmds = base_cmds[1:]
+    except OSError:
+        pass
+
+    # One env build shared by every fallback attempt
+    env = dict(os.environ)
+    env.update(
+        {
+            "FORCE_COLOR": "1",
+            "CLICOLOR": "1",
+            "CLICOLOR_FORCE": "1",
+            "TERM": "xterm-256color",
+        }
+    )
+    env.pop("NO_COLOR", None)
 
     for cmd in base_cmds:
         try:
@@ -398,7 +452,7 @@ def _spawn_setup_install(
                     stdin=slave_fd,
                     stdout=slave_fd,
                     stderr=slave_fd,
-                    env=_env(),
+                    env=env,
                     close_fds=True,
                 )
                 # Close slave end in parent; child keeps it
@@ -406,34 +460,41 @@ def _spawn_setup_install(
                     os.close(slave_fd)
                 except Exception:
                     pass
-                # Wrap master in text IO for readline compatibility (read-only)
+                # Wrap master for readline compatibility (read-only)
                 master_file = os.fdopen(master_fd, "rb", buffering=0)
-                text_stream = io.TextIOWrapper(
-                    master_file, encoding="utf-8", errors="replace", newline="\n"
-                )
 
                 class PTYStdout:
-                    def __init__(self, stream):
-                        self._stream = stream
+                    # Block reads (4KiB per syscall) with incremental
+                    # decode instead of one read+decode per character
+                    def __init__(self, raw):
+                        self._raw = raw
+                        self._decoder = codecs.getincrementaldecoder("utf-8")(
+                            "replace"
+                        )
                         self._buffer = ""
+                        self._eof = False
 
                     def readline(self):
-                        # Accumulate until newline or EOF
                         while True:
-                            chunk = self._stream.read(1)
-                            if not chunk:
-                                if self._buffer:
-                                    out = self._buffer
-                                    self._buffer = ""
-                                    return out
-                                return ""
-                            self._buffer += chunk
                             if "\n" in self._buffer:
-                                line, rest = self._buffer.split("\n", 1)
-                                self._buffer = rest
+                                line, self._buffer = self._buffer.split("\n", 1)
                                 return line + "\n"
+                            if self._eof:
+                                out = self._buffer
+                                self._buffer = ""
+                                return out
+                            try:
+                                chunk = self._raw.read(4096)
+                            except OSError:
+                                # PTYs raise EIO when the child side closes
+                                chunk = b""
+                            if chunk:
+                                self._buffer += self._decoder.decode(chunk)
+                            else:
+                                self._eof = True
+                                self._buffer += self._decoder.decode(b"", True)
 
-                p.stdout = PTYStdout(text_stream)  # type: ignore[attr-defined]
+                p.stdout = PTYStdout(master_file)  # type: ignore[attr-defined]
                 p._pty_master_fd = master_fd  # type: ignore[attr-defined]
                 logger(f"[spawn/pty] {' '.join(cmd)}\n")
             else:
@@ -446,7 +507,7 @@ def _spawn_setup_install(
                     stdin=subprocess.PIPE,
                     universal_newlines=True,
                     bufsize=1,
-                    env=_env(),
+                    env=env,
                 )
                 logger(f"[spawn] {' '.join(cmd)}\n")
 